@@ -23,13 +23,14 @@ from .core import (
     RepositoryIdentity,
     RepositoryStatus,
     SyncStatus,
+    UntrackedMode,
     WorkingTreeStatus,
     app,
     get_global_identity,
     load_roots_file,
 )
 from .formatters import OutputFormatter
-from .schema import get_tool_schema
+from .schema import get_tool_schema, get_tool_schema_for, get_tool_schema_json
 
 __all__ = [
     # Version
@@ -45,6 +46,7 @@ __all__ = [
     "RepositoryIdentity",
     "RepositoryStatus",
     "SyncStatus",
+    "UntrackedMode",
     "WorkingTreeStatus",
     # Operations
     "FleetManager",
@@ -54,6 +56,8 @@ __all__ = [
     # Functions
     "get_global_identity",
     "get_tool_schema",
+    "get_tool_schema_for",
+    "get_tool_schema_json",
     "load_roots_file",
     # Formatters
     "OutputFormatter",
@@ -7,30 +7,30 @@ pull, push, and sync operations across your entire development directory.
 
 from __future__ import annotations
 
-import json
+import functools
 import os
+import shutil
 import subprocess
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from enum import StrEnum
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    MofNCompleteColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-)
 
 from ._version import __version__
-from .formatters import OutputFormatter
-from .schema import get_tool_schema
+from .formatters import OutputFormatter, write_json
+from .schema import get_tool_schema_json
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
 # =============================================================================
 # Domain Models
@@ -65,10 +65,37 @@ class PullMode(StrEnum):
     FORCE = "force"  # pull everything regardless
 
 
+class UntrackedMode(StrEnum):
+    """Untracked file scanning for status (git --untracked-files)."""
+
+    NO = "no"  # skip the untracked walk entirely (fastest on huge trees)
+    NORMAL = "normal"  # count untracked directories as one entry
+    ALL = "all"  # count every untracked file
+
+
 DEFAULT_MAX_WORKERS = 8
 
+# Worker pools shared by every fleet operation in the process, keyed by width.
+# Work items must not submit to and then wait on the same pool (deadlock).
+_EXECUTORS: dict[int, ThreadPoolExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the persistent worker pool for ``max_workers``, creating it once.
 
-@dataclass
+    Reusing the pool across calls avoids spawning and joining a fresh set of
+    threads for every fan-out (sync alone runs six of them back to back).
+    """
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(max_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="git-fleet")
+            _EXECUTORS[max_workers] = executor
+        return executor
+
+
+@dataclass(slots=True)
 class RepositoryStatus:
     """Complete status of a Git repository."""
 
@@ -138,7 +165,7 @@ class RepositoryStatus:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationResult:
     """Result of a Git operation."""
 
@@ -164,7 +191,7 @@ class OperationResult:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class FleetSummary:
     """Summary of fleet status."""
 
@@ -181,7 +208,7 @@ class FleetSummary:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncOperationSummary:
     """Summary of sync operation results."""
 
@@ -200,20 +227,23 @@ class SyncOperationSummary:
     @classmethod
     def from_results(
         cls,
-        fetch_results: list[OperationResult],
-        pull_results: list[OperationResult],
-        push_results: list[OperationResult],
+        fetch_results: Iterable[OperationResult],
+        pull_results: Iterable[OperationResult],
+        push_results: Iterable[OperationResult],
     ) -> SyncOperationSummary:
         """Build sync operation summary from operation results."""
+        fetched, fetched_failed, fetched_warned = cls._tally(fetch_results)
+        pulled, pulled_failed, pulled_warned = cls._tally(pull_results)
+        pushed, pushed_failed, _ = cls._tally(push_results)
         return cls(
-            fetched=sum(1 for r in fetch_results if r.success),
-            fetched_failed=sum(1 for r in fetch_results if not r.success),
-            fetched_warned=sum(1 for r in fetch_results if r.success and r.warning),
-            pulled=sum(1 for r in pull_results if r.success),
-            pulled_failed=sum(1 for r in pull_results if not r.success),
-            pulled_warned=sum(1 for r in pull_results if r.success and r.warning),
-            pushed=sum(1 for r in push_results if r.success),
-            pushed_failed=sum(1 for r in push_results if not r.success),
+            fetched=fetched,
+            fetched_failed=fetched_failed,
+            fetched_warned=fetched_warned,
+            pulled=pulled,
+            pulled_failed=pulled_failed,
+            pulled_warned=pulled_warned,
+            pushed=pushed,
+            pushed_failed=pushed_failed,
         )
 
     @classmethod
@@ -224,14 +254,28 @@ class SyncOperationSummary:
         push_results: list[tuple[Path, list[OperationResult]]],
     ) -> SyncOperationSummary:
         """Build sync operation summary from multi-root operation results."""
-        # Flatten results from all roots
-        flat_fetch = [r for _, results in fetch_results for r in results]
-        flat_pull = [r for _, results in pull_results for r in results]
-        flat_push = [r for _, results in push_results for r in results]
-        return cls.from_results(flat_fetch, flat_pull, flat_push)
+        # Flatten results from all roots lazily; each is tallied in one pass
+        return cls.from_results(
+            chain.from_iterable(results for _, results in fetch_results),
+            chain.from_iterable(results for _, results in pull_results),
+            chain.from_iterable(results for _, results in push_results),
+        )
+
+    @staticmethod
+    def _tally(results: Iterable[OperationResult]) -> tuple[int, int, int]:
+        """Count (succeeded, failed, succeeded with warning) in a single pass."""
+        succeeded = failed = warned = 0
+        for r in results:
+            if r.success:
+                succeeded += 1
+                if r.warning:
+                    warned += 1
+            else:
+                failed += 1
+        return succeeded, failed, warned
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryIdentity:
     """Git identity configuration for a repository."""
 
@@ -255,7 +299,7 @@ class RepositoryIdentity:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalIdentity:
     """Global Git identity configuration."""
 
@@ -269,7 +313,7 @@ class GlobalIdentity:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoteInfo:
     """Information about a single Git remote."""
 
@@ -287,7 +331,7 @@ class RemoteInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryRemotes:
     """Remote configuration for a repository."""
 
@@ -303,7 +347,7 @@ class RepositoryRemotes:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryDiff:
     """File-level diff information for a repository."""
 
@@ -339,48 +383,184 @@ class RepositoryDiff:
 
 _CASE_INSENSITIVE_FS_MSG = "case-insensitive filesystem"
 
+# Absolute path lets subprocess use posix_spawn() and skips a PATH search per call
+_GIT_EXECUTABLE = shutil.which("git") or "git"
+
+# Refs consulted (in order) to determine a repository's default branch
+_DEFAULT_BRANCH_REFS = ("refs/remotes/origin/HEAD", "refs/heads/main", "refs/heads/master")
+
+
+@functools.cache
+def _git_supports_fsmonitor_daemon() -> bool:
+    """Check whether the installed git ships the builtin fsmonitor daemon."""
+    try:
+        result = subprocess.run(
+            [_GIT_EXECUTABLE, "version", "--build-options"],
+            capture_output=True,
+            text=True,
+            check=False,
+            close_fds=False,
+        )
+        return "fsmonitor--daemon" in result.stdout
+    except Exception:
+        return False
+
+
+# Upper bound on remotes fetched concurrently within one repository
+_MAX_FETCH_JOBS = 4
+
+# Bytes read from HEAD; longer files are left to git to interpret
+_HEAD_READ_SIZE = 256
+
+# Upper bound on paths passed to a single git invocation as a pathspec
+_PATHSPEC_BATCH_SIZE = 500
+
+
+def _count_lines(output: bytes) -> int:
+    """Count lines in raw command output, tolerating a missing final newline."""
+    if not output:
+        return 0
+    return output.count(b"\n") + (not output.endswith(b"\n"))
+
+
+def _parse_raw_date(raw: str) -> datetime | None:
+    """Parse git's raw date format ("<unix seconds> <+hhmm>"), keeping the offset."""
+    seconds, _, zone = raw.strip().partition(" ")
+    try:
+        offset = timedelta(hours=int(zone[1:3]), minutes=int(zone[3:5]))
+        tz = timezone(-offset if zone[0] == "-" else offset)
+        return datetime.fromtimestamp(int(seconds), tz)
+    except (ValueError, IndexError, OverflowError):
+        return None
+
 
 class GitOperations:
     """Low-level Git operations for a single repository."""
 
     def __init__(self, repo_path: Path):
         self.repo_path = repo_path
+        self._git_dirs: tuple[Path, Path] | None = None
+        self._config_mtime_ns: int | None = None
+        self._config_cache: dict[str, Any] = {}
+        self._branch_summaries: dict[str, tuple[tuple, tuple[datetime | None, str]]] = {}
+
+    def _get_git_dirs(self) -> tuple[Path, Path]:
+        """Return (git_dir, common_dir), following worktree gitdir links."""
+        if self._git_dirs is None:
+            git_dir = self.repo_path / ".git"
+            common_dir = git_dir
+            if git_dir.is_file():
+                # Worktree/submodule: ".git" holds "gitdir: <path>"
+                content = git_dir.read_text().strip()
+                if content.startswith("gitdir: "):
+                    git_dir = (self.repo_path / content[len("gitdir: ") :]).resolve()
+                common_dir = git_dir
+                commondir = git_dir / "commondir"
+                if commondir.is_file():
+                    common_dir = (git_dir / commondir.read_text().strip()).resolve()
+            self._git_dirs = (git_dir, common_dir)
+        return self._git_dirs
+
+    def _get_config_path(self) -> Path:
+        """Locate the repository config file (shared by all worktrees)."""
+        return self._get_git_dirs()[1] / "config"
+
+    def _read_head(self) -> str | None:
+        """Read HEAD without spawning git.
+
+        Returns the ref HEAD points at, "" when detached, or None when HEAD
+        cannot be interpreted directly (unreadable, or a reftable repository).
+        """
+        try:
+            with open(self._get_git_dirs()[0] / "HEAD", "rb") as f:
+                content = f.read(_HEAD_READ_SIZE)
+        except OSError:
+            return None
+        if len(content) == _HEAD_READ_SIZE:
+            return None  # unusually long ref name; let git resolve it
+        content = content.rstrip()
+        if not content.startswith(b"ref: "):
+            return ""
+        try:
+            ref = content[len(b"ref: ") :].decode()
+        except UnicodeDecodeError:
+            return None
+        # Reftable repositories keep a placeholder HEAD file on disk
+        return None if ref == "refs/heads/.invalid" else ref
 
-    def _run(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
-        """Run a git command in the repository."""
+    def _cached_config(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Memoize a value derived from the repository config.
+
+        The cache is dropped whenever the config file's mtime changes, so a
+        single stat replaces a git subprocess on repeat lookups.
+        """
+        try:
+            mtime_ns = self._get_config_path().stat().st_mtime_ns
+        except OSError:
+            return compute()
+        if mtime_ns != self._config_mtime_ns:
+            self._config_cache.clear()
+            self._config_mtime_ns = mtime_ns
+        if key not in self._config_cache:
+            self._config_cache[key] = compute()
+        return self._config_cache[key]
+
+    def _run(
+        self, *args: str, check: bool = True, text: bool = True
+    ) -> subprocess.CompletedProcess:
+        """Run a git command in the repository.
+
+        Pass text=False to get raw bytes and skip decoding large outputs.
+        """
         return subprocess.run(
-            ["git", *args],
-            cwd=self.repo_path,
+            self._git_argv(*args),
             capture_output=True,
-            text=True,
+            text=text,
             check=check,
+            close_fds=False,
         )
 
+    def _iter_output(self, *args: str) -> Iterator[bytes]:
+        """Yield raw output lines of a git command as they are produced.
+
+        Closing the iterator early terminates git, so callers that only need a
+        prefix of the output neither wait for nor buffer the rest.
+        """
+        with subprocess.Popen(
+            self._git_argv(*args),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+        ) as proc:
+            try:
+                if proc.stdout:
+                    yield from proc.stdout
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+
+    def _git_argv(self, *args: str) -> list[str]:
+        """Build a git command line for this repository.
+
+        'git -C' is used instead of cwd= (and callers pass close_fds=False) so
+        that subprocess can launch git with posix_spawn() rather than fork().
+        Python's own descriptors are non-inheritable, so nothing leaks.
+        """
+        return [_GIT_EXECUTABLE, "-C", str(self.repo_path), *args]
+
     def get_remote_names(self) -> list[str]:
         """Get configured remote names."""
-        try:
-            result = self._run("remote", check=False)
-            if result.returncode == 0 and result.stdout.strip():
-                return [n.strip() for n in result.stdout.splitlines() if n.strip()]
-        except Exception:
-            pass
-        return []
+        # Shares the cached 'git remote -v' listing with get_remotes
+        return [remote.name for remote in self.get_remotes()]
 
     def get_default_fetch_remote(self) -> str:
         """Get the remote that should be fetched for routine sync."""
         current_branch = self.get_current_branch()
         if current_branch and current_branch != "HEAD":
-            try:
-                result = self._run(
-                    "config",
-                    "--get",
-                    f"branch.{current_branch}.remote",
-                    check=False,
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    return result.stdout.strip()
-            except Exception:
-                pass
+            key = f"branch.{current_branch}.remote"
+            remote = self._cached_config(key, lambda: self._read_config(key, False))
+            if remote:
+                return remote
 
         remotes = self.get_remote_names()
         if "origin" in remotes:
@@ -399,6 +579,11 @@ class GitOperations:
                 args = ["fetch", "--all"]
                 if prune:
                     args.append("--prune")
+                # Talk to several remotes concurrently rather than one after another.
+                # The count comes from the cached 'git remote -v' listing
+                remote_count = len(self.get_remote_names())
+                if remote_count > 1:
+                    args.append(f"--jobs={min(remote_count, _MAX_FETCH_JOBS)}")
             else:
                 remote = self.get_default_fetch_remote()
                 if not remote:
@@ -419,8 +604,40 @@ class GitOperations:
         except Exception as e:
             return False, str(e), ""
 
+    def enable_status_caches(self) -> tuple[bool, str]:
+        """Enable core.untrackedCache, plus core.fsmonitor where git supports it.
+
+        Keys the user already configured (in any scope) are left untouched.
+        Returns (success, message_or_error).
+        """
+        wanted = ["core.untrackedcache"]
+        if _git_supports_fsmonitor_daemon():
+            wanted.append("core.fsmonitor")
+        try:
+            result = self._run(
+                "config", "--get-regexp", r"^core\.(untrackedcache|fsmonitor)$", check=False
+            )
+            configured = {line.partition(" ")[0] for line in result.stdout.splitlines()}
+            enabled = []
+            for key in wanted:
+                if key in configured:
+                    continue
+                result = self._run("config", "--local", key, "true", check=False)
+                if result.returncode != 0:
+                    return False, result.stderr.strip()
+                enabled.append(key)
+            return True, f"Enabled {', '.join(enabled)}" if enabled else "Already configured"
+        except Exception as e:
+            return False, str(e)
+
     def get_current_branch(self) -> str:
-        """Get current branch name."""
+        """Get current branch name ("HEAD" when detached)."""
+        head = self._read_head()
+        if head is not None:
+            if head.startswith("refs/heads/"):
+                return head[len("refs/heads/") :]
+            if not head:
+                return "HEAD"
         try:
             result = self._run("rev-parse", "--abbrev-ref", "HEAD", check=False)
             if result.returncode == 0:
@@ -453,32 +670,88 @@ class GitOperations:
             pass
         return 0, 0
 
+    def get_tracking_info(self) -> tuple[str, str, int, int]:
+        """Get branch, upstream and ahead/behind counts without scanning the working tree.
+
+        Returns (branch, remote_branch, ahead, behind); branch is "(detached)"
+        when HEAD does not point at a branch, matching get_status_porcelain.
+        """
+        branch = self.get_current_branch()
+        if branch in ("", "HEAD"):
+            return ("(detached)" if branch else ""), "", 0, 0
+        try:
+            result = self._run(
+                "for-each-ref",
+                "--format=%(upstream:short)%00%(upstream:track,nobracket)",
+                f"refs/heads/{branch}",
+                check=False,
+            )
+            if result.returncode != 0:
+                return branch, "", 0, 0
+            remote_branch, _, track = result.stdout.rstrip("\n").partition("\0")
+            # Track format: "ahead N", "behind M", "ahead N, behind M", "gone" or ""
+            ahead = behind = 0
+            for part in track.split(", "):
+                kind, _, count = part.partition(" ")
+                if kind == "ahead":
+                    ahead = int(count)
+                elif kind == "behind":
+                    behind = int(count)
+            return branch, remote_branch, ahead, behind
+        except Exception:
+            return branch, "", 0, 0
+
     def get_staged_count(self) -> int:
-        """Count staged changes."""
+        """Count staged changes.
+
+        Not used for status collection; get_status_porcelain() returns all counts
+        from a single git call.
+        """
         try:
-            result = self._run("diff", "--cached", "--numstat", check=False)
+            result = self._run("diff", "--cached", "--numstat", check=False, text=False)
             if result.returncode == 0:
-                return len([line for line in result.stdout.strip().split("\n") if line])
+                return _count_lines(result.stdout)
         except Exception:
             pass
         return 0
 
     def get_unstaged_count(self) -> int:
-        """Count unstaged changes."""
+        """Count unstaged changes.
+
+        Not used for status collection; get_status_porcelain() returns all counts
+        from a single git call.
+        """
         try:
-            result = self._run("diff", "--numstat", check=False)
+            result = self._run("diff", "--numstat", check=False, text=False)
             if result.returncode == 0:
-                return len([line for line in result.stdout.strip().split("\n") if line])
+                return _count_lines(result.stdout)
         except Exception:
             pass
         return 0
 
-    def get_untracked_count(self) -> int:
-        """Count untracked files."""
+    def get_untracked_count(self, limit: int | None = None) -> int:
+        """Count untracked files.
+
+        Not used for status collection; get_status_porcelain() returns all counts
+        from a single git call. With a limit, counting stops (and git is
+        terminated) once the limit is reached, e.g. for "100+" style displays.
+        """
+        if limit is not None:
+            count = 0
+            try:
+                for _ in self._iter_output("ls-files", "--others", "--exclude-standard"):
+                    count += 1
+                    if count >= limit:
+                        break
+            except Exception:
+                pass
+            return count
         try:
-            result = self._run("ls-files", "--others", "--exclude-standard", check=False)
+            result = self._run(
+                "ls-files", "--others", "--exclude-standard", check=False, text=False
+            )
             if result.returncode == 0:
-                return len([line for line in result.stdout.strip().split("\n") if line])
+                return _count_lines(result.stdout)
         except Exception:
             pass
         return 0
@@ -487,31 +760,109 @@ class GitOperations:
         """Get the default branch name from origin/HEAD.
 
         Falls back to 'main' or 'master' if origin/HEAD is not set.
+        All three refs are resolved by a single for-each-ref call.
+        """
+        refs = self._get_refs(*_DEFAULT_BRANCH_REFS)
+        return self._pick_default_branch(refs) if refs is not None else ""
+
+    def get_branch_summary(self, branch: str) -> tuple[datetime | None, str]:
+        """Get (last_commit_date, default_branch) with one for-each-ref call.
+
+        The committer date comes from the branch tip, which is HEAD when the
+        branch is checked out. Falls back to 'git log' when the branch has no
+        ref (detached or unborn HEAD). Results are reused while the ref files
+        they derive from are unchanged.
+        """
+        signature = self._get_refs_signature(branch)
+        if signature is not None:
+            cached = self._branch_summaries.get(branch)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        summary = self._read_branch_summary(branch)
+        if signature is not None:
+            self._branch_summaries[branch] = (signature, summary)
+        return summary
+
+    def _get_refs_signature(self, branch: str) -> tuple | None:
+        """Stat the files that determine get_branch_summary()'s answer.
+
+        Git replaces ref files by renaming a lock file over them, so
+        (inode, mtime, size) changes whenever a ref moves. Returns None when
+        refs are not plain files (reftable) and must not be cached.
+        """
+        if self._read_head() is None:
+            return None
+        git_dir, common_dir = self._get_git_dirs()
+        paths = [
+            git_dir / "HEAD",
+            common_dir / "packed-refs",
+            common_dir / "refs" / "heads" / branch,
+            *(common_dir / ref for ref in _DEFAULT_BRANCH_REFS),
+        ]
+        signature: list[tuple[int, int, int] | None] = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+                signature.append((st.st_ino, st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _read_branch_summary(self, branch: str) -> tuple[datetime | None, str]:
+        branch_ref = f"refs/heads/{branch}"
+        refs = self._get_refs(branch_ref, *_DEFAULT_BRANCH_REFS)
+        if refs is None:
+            return self.get_last_commit_date(), ""
+        last_commit_date = None
+        if branch and branch_ref in refs:
+            last_commit_date = _parse_raw_date(refs[branch_ref][1])
+        if last_commit_date is None:
+            last_commit_date = self.get_last_commit_date()
+        return last_commit_date, self._pick_default_branch(refs)
+
+    def _get_refs(self, *patterns: str) -> dict[str, tuple[str, str]] | None:
+        """Map refnames matching patterns to (symref target, committer date).
+
+        Returns None if git could not be queried.
         """
         try:
-            result = self._run("symbolic-ref", "refs/remotes/origin/HEAD", check=False)
-            if result.returncode == 0:
-                # Output: refs/remotes/origin/main -> extract "main"
-                ref = result.stdout.strip()
-                return ref.rsplit("/", 1)[-1]
+            result = self._run(
+                "for-each-ref",
+                "--format=%(refname)%00%(symref)%00%(committerdate:raw)",
+                *patterns,
+                check=False,
+            )
+            if result.returncode != 0:
+                return None
         except Exception:
-            pass
+            return None
+        refs = {}
+        for line in result.stdout.splitlines():
+            refname, symref, date = line.split("\0")
+            refs[refname] = (symref, date)
+        return refs
+
+    @staticmethod
+    def _pick_default_branch(refs: dict[str, tuple[str, str]]) -> str:
+        # Symref target: refs/remotes/origin/main -> extract "main"
+        origin_head = refs.get("refs/remotes/origin/HEAD", ("", ""))[0]
+        if origin_head:
+            return origin_head.rsplit("/", 1)[-1]
         # Fallback: check if main or master exists
         for name in ("main", "master"):
-            try:
-                result = self._run("rev-parse", "--verify", f"refs/heads/{name}", check=False)
-                if result.returncode == 0:
-                    return name
-            except Exception:
-                pass
+            if f"refs/heads/{name}" in refs:
+                return name
         return ""
 
     def get_status_porcelain(
         self,
+        untracked: UntrackedMode | None = None,
     ) -> dict:
         """Get branch, ahead/behind, staged/unstaged/untracked counts in one command.
 
-        Uses 'git status --porcelain=v2 --branch' to minimize subprocess calls.
+        Uses 'git status --porcelain=v2 --branch -z' to minimize subprocess calls;
+        NUL-separated records keep paths containing newlines from skewing counts.
+        untracked overrides --untracked-files (None keeps git's configured default).
         Returns a dict with keys: branch, remote_branch, ahead, behind,
         staged_count, unstaged_count, untracked_count.
         """
@@ -525,32 +876,41 @@ class GitOperations:
             "untracked_count": 0,
         }
         try:
-            result = self._run("status", "--porcelain=v2", "--branch", check=False)
+            args = ["status", "--porcelain=v2", "--branch", "-z"]
+            if untracked is not None:
+                args.append(f"--untracked-files={untracked}")
+            result = self._run(*args, check=False, text=False)
             if result.returncode != 0:
                 return info
-            for line in result.stdout.splitlines():
-                if line.startswith("# branch.head "):
-                    info["branch"] = line[len("# branch.head ") :]
-                elif line.startswith("# branch.upstream "):
-                    info["remote_branch"] = line[len("# branch.upstream ") :]
-                elif line.startswith("# branch.ab "):
-                    # Format: # branch.ab +<ahead> -<behind>
-                    parts = line.split()
-                    if len(parts) == 4:
-                        info["ahead"] = abs(int(parts[2]))
-                        info["behind"] = abs(int(parts[3]))
-                elif line.startswith("1 ") or line.startswith("2 "):
+            # Parse as bytes: only the branch header values are ever decoded
+            records = iter(result.stdout.split(b"\0"))
+            for record in records:
+                kind = record[:1]
+                if kind == b"#":
+                    if record.startswith(b"# branch.head "):
+                        info["branch"] = record[len(b"# branch.head ") :].decode()
+                    elif record.startswith(b"# branch.upstream "):
+                        info["remote_branch"] = record[len(b"# branch.upstream ") :].decode()
+                    elif record.startswith(b"# branch.ab "):
+                        # Format: # branch.ab +<ahead> -<behind>
+                        parts = record.split()
+                        if len(parts) == 4:
+                            info["ahead"] = abs(int(parts[2]))
+                            info["behind"] = abs(int(parts[3]))
+                elif kind == b"1" or kind == b"2":
                     # Changed entry: XY sub mH mI mW hH hI path
-                    xy = line[2:4]
-                    if xy[0] != ".":
+                    if record[2:3] != b".":
                         info["staged_count"] += 1
-                    if xy[1] != ".":
+                    if record[3:4] != b".":
                         info["unstaged_count"] += 1
-                elif line.startswith("u "):
+                    if kind == b"2":
+                        # Rename/copy: the original path follows as its own record
+                        next(records, None)
+                elif kind == b"u":
                     # Unmerged entry: counts as both staged and unstaged
                     info["staged_count"] += 1
                     info["unstaged_count"] += 1
-                elif line.startswith("? "):
+                elif kind == b"?":
                     info["untracked_count"] += 1
         except Exception:
             pass
@@ -596,37 +956,53 @@ class GitOperations:
             pass
         return []
 
+    def is_dirty(self) -> bool:
+        """Check for any staged, unstaged or untracked change, stopping at the first one.
+
+        'diff-index --quiet HEAD' exits at the first tracked change; only when
+        there is none is the untracked listing streamed, and git is terminated
+        at its first line. Errors (including an unborn HEAD) count as dirty.
+        """
+        try:
+            result = self._run("diff-index", "--quiet", "HEAD", "--", check=False)
+            if result.returncode != 0:
+                return True
+            for _ in self._iter_output("ls-files", "--others", "--exclude-standard"):
+                return True
+            return False
+        except Exception:
+            return True
+
     def get_last_commit_date(self) -> datetime | None:
         """Get last commit date."""
         try:
-            result = self._run("log", "-1", "--format=%cI", check=False)
+            result = self._run("log", "-1", "--format=%cd", "--date=raw", check=False)
             if result.returncode == 0 and result.stdout.strip():
-                return datetime.fromisoformat(result.stdout.strip())
+                return _parse_raw_date(result.stdout)
         except Exception:
             pass
         return None
 
     def get_user_name(self, local_only: bool = False) -> str:
         """Get configured user.name."""
-        try:
-            args = ["config"]
-            if local_only:
-                args.append("--local")
-            args.append("user.name")
-            result = self._run(*args, check=False)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-        return ""
+        return self._get_user_config("user.name", local_only)
 
     def get_user_email(self, local_only: bool = False) -> str:
         """Get configured user.email."""
+        return self._get_user_config("user.email", local_only)
+
+    def _get_user_config(self, key: str, local_only: bool) -> str:
+        if local_only:
+            # Local values live entirely in the repository config file
+            return self._cached_config(f"local:{key}", lambda: self._read_config(key, True))
+        return self._read_config(key, False)
+
+    def _read_config(self, key: str, local_only: bool) -> str:
         try:
             args = ["config"]
             if local_only:
                 args.append("--local")
-            args.append("user.email")
+            args.append(key)
             result = self._run(*args, check=False)
             if result.returncode == 0:
                 return result.stdout.strip()
@@ -642,34 +1018,70 @@ class GitOperations:
             source_type: "local", "global", "included", "system", or "unknown"
         """
         try:
-            result = self._run("config", "--show-origin", key, check=False)
+            result = self._run("config", "--show-origin", "-z", "--get", key, check=False)
             if result.returncode == 0:
-                output = result.stdout.strip()
-                # Format: "file:/path/to/config\tvalue"
-                if "\t" in output:
-                    origin, value = output.split("\t", 1)
+                # Format: "file:<path>\0<value>\0" - no quoting of unusual paths
+                origin, _, value = result.stdout.partition("\0")
+                if value:
                     source_file = origin.replace("file:", "", 1)
-
-                    # Determine source type from file path
-                    # Order matters: check more specific patterns first
-                    if source_file.endswith(".git/config"):
-                        source_type = "local"
-                    elif source_file.endswith("/etc/gitconfig"):
-                        source_type = "system"
-                    elif source_file.endswith("/.gitconfig") or source_file.endswith(
-                        "/.config/git/config"
-                    ):
-                        # Only exact ~/.gitconfig or ~/.config/git/config is "global"
-                        source_type = "global"
-                    else:
-                        # includeIf files like ~/.gitconfig-work, ~/.gitconfig-private
-                        source_type = "included"
-
-                    return value, source_type, source_file
+                    value = value.removesuffix("\0")
+                    return value, self._classify_config_source(source_file), source_file
         except Exception:
             pass
         return "", "unknown", ""
 
+    def get_identity_config(self) -> tuple[str, str, str, str, bool]:
+        """Get identity settings from a single 'git config --list --show-origin'.
+
+        Returns:
+            tuple of (user_name, user_email, source_type, source_file,
+            has_local_override); the source describes where user.email is set.
+        """
+        effective: dict[str, tuple[str, str]] = {}
+        has_local_override = False
+        try:
+            result = self._run("config", "--list", "--show-origin", "-z", check=False)
+            if result.returncode != 0:
+                return "", "", "unknown", "", False
+            # Records: "<origin>\0<key>\n<value>\0"; later entries override earlier ones
+            fields = result.stdout.split("\0")
+            for origin, entry in zip(fields[0::2], fields[1::2]):
+                key, _, value = entry.partition("\n")
+                if key not in ("user.name", "user.email"):
+                    continue
+                source_file = origin.replace("file:", "", 1)
+                effective[key] = (value, source_file)
+                if value and self._classify_config_source(source_file) == "local":
+                    has_local_override = True
+        except Exception:
+            return "", "", "unknown", "", False
+
+        user_name = effective.get("user.name", ("", ""))[0]
+        if "user.email" not in effective:
+            return user_name, "", "unknown", "", has_local_override
+        user_email, source_file = effective["user.email"]
+        return (
+            user_name,
+            user_email,
+            self._classify_config_source(source_file),
+            source_file,
+            has_local_override,
+        )
+
+    @staticmethod
+    def _classify_config_source(source_file: str) -> str:
+        """Determine the config scope from the file a value came from."""
+        # Order matters: check more specific patterns first
+        if source_file.endswith(".git/config"):
+            return "local"
+        if source_file.endswith("/etc/gitconfig"):
+            return "system"
+        if source_file.endswith("/.gitconfig") or source_file.endswith("/.config/git/config"):
+            # Only exact ~/.gitconfig or ~/.config/git/config is "global"
+            return "global"
+        # includeIf files like ~/.gitconfig-work, ~/.gitconfig-private
+        return "included"
+
     def get_merge_base(self) -> str | None:
         """Get merge-base between HEAD and upstream."""
         try:
@@ -710,16 +1122,40 @@ class GitOperations:
         """Check if local and remote changes overlap at file level.
 
         Returns True if there ARE conflicts (overlap found), False if safe.
+        Local changes are only looked up for the files the upstream touched,
+        and the checks stop at the first overlap.
         """
-        merge_base = self.get_merge_base()
-        if merge_base is None:
-            return True  # can't determine, assume conflict
-
-        remote_files = self.get_changed_files_between(merge_base, "@{u}")
-        local_files = self.get_changed_files_between(merge_base, "HEAD")
-        local_files |= self.get_dirty_files()
+        try:
+            # Three-dot range diffs against the merge-base without resolving it first
+            result = self._run("diff", "--name-only", "-z", "HEAD...@{u}", check=False)
+            if result.returncode != 0:
+                return True  # can't determine, assume conflict
+            remote_files = [f for f in result.stdout.split("\0") if f]
+            for start in range(0, len(remote_files), _PATHSPEC_BATCH_SIZE):
+                if self._has_local_changes_in(remote_files[start : start + _PATHSPEC_BATCH_SIZE]):
+                    return True
+        except Exception:
+            return True
+        return False
 
-        return bool(local_files & remote_files)
+    def _has_local_changes_in(self, paths: list[str]) -> bool:
+        """Check if local commits, uncommitted edits or untracked files touch any path."""
+        for diff_args in (("@{u}...HEAD",), ("HEAD",)):
+            result = self._run(
+                "--literal-pathspecs", "diff", "--quiet", *diff_args, "--", *paths, check=False
+            )
+            if result.returncode != 0:
+                return True
+        result = self._run(
+            "--literal-pathspecs",
+            "ls-files",
+            "--others",
+            "--exclude-standard",
+            "--",
+            *paths,
+            check=False,
+        )
+        return result.returncode != 0 or bool(result.stdout)
 
     def pull(self) -> tuple[bool, str, str]:
         """Pull from remote. Returns (success, message, warning)."""
@@ -762,11 +1198,38 @@ class GitOperations:
             return False, str(e)
 
     def has_remotes(self) -> bool:
-        """Check if any remotes are configured."""
+        """Check if any remotes are configured.
+
+        A remote with a url in the repository config answers this without
+        spawning git; otherwise 'git remote -v' decides (global config, includes).
+        """
+        if self._cached_config("has_remote_url", self._config_has_remote_url):
+            return True
         return bool(self.get_remote_names())
 
+    def _config_has_remote_url(self) -> bool:
+        """Scan the repository config file for a [remote "..."] section with a url."""
+        try:
+            with open(self._get_config_path(), "rb") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return False
+        in_remote = False
+        for line in lines:
+            line = line.strip().lower()
+            if line.startswith(b"["):
+                header, _, line = line.partition(b"]")
+                in_remote = header.startswith(b'[remote "')
+                line = line.lstrip()
+            if in_remote and line.startswith(b"url") and line[3:4] in (b" ", b"\t", b"="):
+                return True
+        return False
+
     def is_detached(self) -> bool:
         """Check if HEAD is in detached state."""
+        head = self._read_head()
+        if head is not None:
+            return not head
         try:
             result = self._run("symbolic-ref", "HEAD", check=False)
             return result.returncode != 0
@@ -775,49 +1238,52 @@ class GitOperations:
 
     def get_remotes(self) -> list[RemoteInfo]:
         """Get all remotes with their URLs."""
-        remotes = []
+        return list(self._cached_config("remotes", self._read_remotes))
+
+    def _read_remotes(self) -> list[RemoteInfo]:
+        # One 'git remote -v' lists every remote as "<name>\t<url> (fetch|push)"
+        urls: dict[str, dict[str, str]] = {}
         try:
-            remote_names = self.get_remote_names()
-
-            for name in remote_names:
-                # Get fetch URL
-                fetch_result = self._run("remote", "get-url", name, check=False)
-                fetch_url = fetch_result.stdout.strip() if fetch_result.returncode == 0 else ""
-
-                # Get push URL (may differ from fetch URL)
-                push_result = self._run("remote", "get-url", "--push", name, check=False)
-                push_url = push_result.stdout.strip() if push_result.returncode == 0 else fetch_url
-
-                # Determine protocol from URL
-                protocol = self._detect_protocol(fetch_url)
-
-                remotes.append(
-                    RemoteInfo(
-                        name=name,
-                        fetch_url=fetch_url,
-                        push_url=push_url,
-                        protocol=protocol,
-                    )
-                )
+            result = self._run("remote", "-v", check=False)
+            if result.returncode != 0:
+                return []
+            for line in result.stdout.splitlines():
+                name, _, rest = line.partition("\t")
+                if not name:
+                    continue
+                # A remote without a url is listed as a bare "<name>\t" line
+                by_kind = urls.setdefault(name, {})
+                url, _, kind = rest.rpartition(" (")
+                if kind in ("fetch)", "push)"):
+                    # Remotes with several URLs list each; git uses the first
+                    by_kind.setdefault(kind[:-1], url)
         except Exception:
-            pass
+            return []
+        remotes = []
+        for name, by_kind in urls.items():
+            fetch_url = by_kind.get("fetch", "")
+            remotes.append(
+                RemoteInfo(
+                    name=name,
+                    fetch_url=fetch_url,
+                    push_url=by_kind.get("push", fetch_url),
+                    protocol=self._detect_protocol(fetch_url),
+                )
+            )
         return remotes
 
     @staticmethod
     def _detect_protocol(url: str) -> str:
         """Detect protocol from Git URL."""
-        if not url:
-            return "unknown"
-        if url.startswith("https://"):
-            return "https"
-        if url.startswith("http://"):
-            return "http"
-        if url.startswith("git://"):
-            return "git"
-        if url.startswith("file://") or url.startswith("/"):
+        scheme, sep, _ = url.partition("://")
+        if sep:
+            match scheme:
+                case "https" | "http" | "git" | "file" | "ssh":
+                    return scheme
+        if url.startswith("/"):
             return "file"
-        if url.startswith("ssh://") or "@" in url:
-            # SSH URLs: ssh://user@host/path or user@host:path
+        if "@" in url:
+            # SCP-style SSH URLs: user@host:path
             return "ssh"
         return "unknown"
 
@@ -843,8 +1309,18 @@ class GitRepository:
         """Check if HEAD is in detached state."""
         return self.ops.is_detached()
 
-    def get_status(self, fetch_first: bool = False) -> RepositoryStatus:
-        """Get complete repository status."""
+    def get_status(
+        self,
+        fetch_first: bool = False,
+        *,
+        include_branch_summary: bool = True,
+        untracked: UntrackedMode | None = None,
+    ) -> RepositoryStatus:
+        """Get complete repository status.
+
+        Pass include_branch_summary=False to skip last commit date and
+        default branch when only sync/working-tree state is needed.
+        """
         status = RepositoryStatus(path=self.path, name=self.name)
 
         try:
@@ -855,7 +1331,7 @@ class GitRepository:
                     status.error_message = f"Fetch failed: {error}"
                     return status
 
-            info = self.ops.get_status_porcelain()
+            info = self.ops.get_status_porcelain(untracked)
             status.branch = info["branch"]
             status.remote_branch = info["remote_branch"]
             status.ahead_count = info["ahead"]
@@ -863,25 +1339,42 @@ class GitRepository:
             status.staged_count = info["staged_count"]
             status.unstaged_count = info["unstaged_count"]
             status.untracked_count = info["untracked_count"]
+            status.sync_status = self._classify_sync(status)
 
-            if status.remote_branch:
-                if status.ahead_count > 0 and status.behind_count > 0:
-                    status.sync_status = SyncStatus.DIVERGED
-                elif status.ahead_count > 0:
-                    status.sync_status = SyncStatus.AHEAD
-                elif status.behind_count > 0:
-                    status.sync_status = SyncStatus.BEHIND
-                else:
-                    status.sync_status = SyncStatus.CLEAN
-            elif status.branch == "(detached)":
-                status.sync_status = SyncStatus.DETACHED
-            elif self.ops.has_remotes():
-                status.sync_status = SyncStatus.NO_UPSTREAM
-            else:
-                status.sync_status = SyncStatus.NO_REMOTE
+            if include_branch_summary:
+                status.last_commit_date, status.default_branch = self.ops.get_branch_summary(
+                    status.branch
+                )
+
+        except Exception as e:
+            status.sync_status = SyncStatus.ERROR
+            status.error_message = str(e)
+
+        return status
+
+    def get_sync_status(self, fetch_first: bool = False) -> RepositoryStatus:
+        """Get branch and ahead/behind status only, skipping the working-tree scan.
+
+        Working-tree counts, last commit date and default branch are left unset,
+        so the result is only suitable for needs_push/needs_pull filtering.
+        """
+        status = RepositoryStatus(path=self.path, name=self.name)
+
+        try:
+            if fetch_first:
+                success, error, _warning = self.ops.fetch_all()
+                if not success:
+                    status.sync_status = SyncStatus.ERROR
+                    status.error_message = f"Fetch failed: {error}"
+                    return status
 
-            status.last_commit_date = self.ops.get_last_commit_date()
-            status.default_branch = self.ops.get_default_branch()
+            (
+                status.branch,
+                status.remote_branch,
+                status.ahead_count,
+                status.behind_count,
+            ) = self.ops.get_tracking_info()
+            status.sync_status = self._classify_sync(status)
 
         except Exception as e:
             status.sync_status = SyncStatus.ERROR
@@ -889,6 +1382,22 @@ class GitRepository:
 
         return status
 
+    def _classify_sync(self, status: RepositoryStatus) -> SyncStatus:
+        """Derive the sync status from branch, upstream and ahead/behind counts."""
+        if status.remote_branch:
+            if status.ahead_count > 0 and status.behind_count > 0:
+                return SyncStatus.DIVERGED
+            if status.ahead_count > 0:
+                return SyncStatus.AHEAD
+            if status.behind_count > 0:
+                return SyncStatus.BEHIND
+            return SyncStatus.CLEAN
+        if status.branch == "(detached)":
+            return SyncStatus.DETACHED
+        if self.ops.has_remotes():
+            return SyncStatus.NO_UPSTREAM
+        return SyncStatus.NO_REMOTE
+
     def fetch(
         self,
         *,
@@ -911,6 +1420,18 @@ class GitRepository:
         """Check if local and remote changes overlap at file level."""
         return self.ops.has_file_conflicts()
 
+    def enable_status_caches(self) -> OperationResult:
+        """Enable git's untracked cache and filesystem monitor for faster status."""
+        success, message = self.ops.enable_status_caches()
+        return OperationResult(
+            path=self.path,
+            name=self.name,
+            success=success,
+            operation="enable-fsmonitor",
+            message=message if success else "",
+            error=message if not success else "",
+        )
+
     def pull(self) -> OperationResult:
         """Pull from remote."""
         success, message, warning = self.ops.pull()
@@ -938,14 +1459,9 @@ class GitRepository:
 
     def get_identity(self) -> RepositoryIdentity:
         """Get repository identity configuration."""
-        # Get email with source info (email is primary for identity)
-        email, source_type, source_file = self.ops.get_config_source("user.email")
-        name, _, _ = self.ops.get_config_source("user.name")
-
-        # Check if there's a local override (for backward compatibility)
-        local_name = self.ops.get_user_name(local_only=True)
-        local_email = self.ops.get_user_email(local_only=True)
-        has_local_override = bool(local_name or local_email)
+        # Email (with its source) is primary for identity; a local value for
+        # either key counts as an override (for backward compatibility)
+        name, email, source_type, source_file, has_local_override = self.ops.get_identity_config()
 
         return RepositoryIdentity(
             path=self.path,
@@ -966,8 +1482,18 @@ class GitRepository:
             remotes=remotes,
         )
 
-    def get_diff(self) -> RepositoryDiff:
-        """Get file-level diff information."""
+    def is_dirty(self) -> bool:
+        """Check whether the working tree or index has any change."""
+        return self.ops.is_dirty()
+
+    def get_diff(self, skip_clean: bool = False) -> RepositoryDiff:
+        """Get file-level diff information.
+
+        With skip_clean, a cheap early-exit probe runs first and a clean
+        repository returns an empty diff without the three listing commands.
+        """
+        if skip_clean and not self.is_dirty():
+            return RepositoryDiff(path=self.path, name=self.name)
         return RepositoryDiff(
             path=self.path,
             name=self.name,
@@ -993,26 +1519,45 @@ class FleetManager:
         *,
         include_no_remote: bool = True,
         include_detached: bool = True,
+        _resolved: bool = False,
     ):
-        self.root_path = root_path.resolve()
+        # MultiRootFleetManager resolves its roots once and passes _resolved=True
+        self.root_path = root_path if _resolved else root_path.resolve()
         self.max_workers = max_workers
         self.include_no_remote = include_no_remote
         self.include_detached = include_detached
         self._repositories: list[GitRepository] | None = None
 
     def discover_repositories(self) -> list[GitRepository]:
-        """Discover all Git repositories under root path."""
+        """Discover all Git repositories under root path.
+
+        Candidates are recognised from the filesystem alone (a ".git"
+        directory), so non-repository directories never cost a git call.
+        """
         if self._repositories is not None:
             return self._repositories
 
+        # Iterative scandir walk: dirent types avoid a stat per entry, and
+        # ".git" directories themselves are never descended into. Paths stay
+        # plain strings (entry.path) until a repository is found.
         repos = []
-        for git_dir in self.root_path.rglob(".git"):
-            if git_dir.is_dir():
-                repo_path = git_dir.parent
-                repos.append(GitRepository(repo_path))
-
-        # Sort by path for consistent ordering
-        repos.sort(key=lambda r: r.path)
+        stack = [str(self.root_path)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name == ".git":
+                            if entry.is_dir():
+                                repos.append(GitRepository(Path(directory)))
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError:
+                continue
+
+        # Sort by path for consistent ordering. With NUL for the separator, plain
+        # string comparison orders component-wise exactly like Path.__lt__
+        repos.sort(key=lambda r: str(r.path).replace(os.sep, "\0"))
 
         if not self.include_no_remote:
             repos = [r for r in repos if r.has_remotes()]
@@ -1033,38 +1578,108 @@ class FleetManager:
         if repos is None:
             repos = self.discover_repositories()
 
-        results = []
+        # Results land at their repository's index, keeping the (path-sorted) input order
+        results: list = [None] * len(repos)
+        for i, result in self._iter_parallel(operation, repos, sequential):
+            results[i] = result
+            if on_repo_done:
+                on_repo_done()
+        return results
 
+    def _iter_parallel(
+        self,
+        operation: Callable[[GitRepository], Any],
+        repos: list[GitRepository],
+        sequential: bool = False,
+    ) -> Iterator[tuple[int, Any]]:
+        """Yield (index into repos, result) as each operation completes."""
         if sequential or len(repos) <= 1:
-            for repo in repos:
-                results.append(operation(repo))
-                if on_repo_done:
-                    on_repo_done()
-        else:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {executor.submit(operation, repo): repo for repo in repos}
-                for future in as_completed(futures):
-                    results.append(future.result())
-                    if on_repo_done:
-                        on_repo_done()
+            for i, repo in enumerate(repos):
+                yield i, operation(repo)
+            return
 
-        # Sort by path for consistent ordering
-        results.sort(key=lambda r: r.path if hasattr(r, "path") else str(r))
-        return results
+        executor = _get_executor(self.max_workers)
+        futures = {executor.submit(operation, repo): i for i, repo in enumerate(repos)}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # Consumer stopped early: drop work that has not started yet
+            for future in futures:
+                future.cancel()
+
+    def iter_status(
+        self,
+        fetch_first: bool = True,
+        sequential: bool = False,
+    ) -> Iterator[RepositoryStatus]:
+        """Yield repository statuses as they complete (completion order, not sorted)."""
+        for _, status in self._iter_parallel(
+            lambda repo: repo.get_status(fetch_first=fetch_first),
+            self.discover_repositories(),
+            sequential,
+        ):
+            yield status
 
     def get_all_status(
         self,
         fetch_first: bool = True,
         sequential: bool = False,
         on_repo_done: Callable[[], None] | None = None,
+        *,
+        include_branch_summary: bool = True,
+        untracked: UntrackedMode | None = None,
     ) -> list[RepositoryStatus]:
         """Get status of all repositories."""
         return self._execute_parallel(
-            lambda repo: repo.get_status(fetch_first=fetch_first),
+            lambda repo: repo.get_status(
+                fetch_first=fetch_first,
+                include_branch_summary=include_branch_summary,
+                untracked=untracked,
+            ),
             sequential=sequential,
             on_repo_done=on_repo_done,
         )
 
+    def refresh_statuses(
+        self,
+        statuses: list[RepositoryStatus],
+        results: list[OperationResult],
+        sequential: bool = False,
+        on_repo_done: Callable[[], None] | None = None,
+    ) -> list[RepositoryStatus]:
+        """Re-read status only for the repositories an operation touched.
+
+        Repositories without a result keep their previous status, so a pull
+        or push step that touched nothing costs no second scan.
+        """
+        touched = {result.path for result in results}
+        repos = [repo for repo in self.discover_repositories() if repo.path in touched]
+        if on_repo_done:
+            for _ in range(len(statuses) - len(repos)):
+                on_repo_done()
+        refreshed = {
+            status.path: status
+            for status in self._execute_parallel(
+                lambda repo: repo.get_status(),
+                repos=repos,
+                sequential=sequential,
+                on_repo_done=on_repo_done,
+            )
+        }
+        return [refreshed.get(status.path, status) for status in statuses]
+
+    def get_all_sync_status(
+        self,
+        fetch_first: bool = True,
+        sequential: bool = False,
+    ) -> list[RepositoryStatus]:
+        """Get branch and ahead/behind status of all repositories (no working-tree scan)."""
+        return self._execute_parallel(
+            lambda repo: repo.get_sync_status(fetch_first=fetch_first),
+            sequential=sequential,
+        )
+
     def fetch_all(
         self,
         sequential: bool = False,
@@ -1080,6 +1695,13 @@ class FleetManager:
             on_repo_done=on_repo_done,
         )
 
+    def enable_status_caches(self, sequential: bool = False) -> list[OperationResult]:
+        """Enable untracked cache / fsmonitor in all repositories (opt-in)."""
+        return self._execute_parallel(
+            lambda repo: repo.enable_status_caches(),
+            sequential=sequential,
+        )
+
     def pull_all(
         self,
         only_behind: bool = True,
@@ -1093,55 +1715,13 @@ class FleetManager:
 
         if only_behind:
             if statuses is None:
-                statuses = self.get_all_status(fetch_first=True, sequential=sequential)
-            if mode == PullMode.FORCE:
-                repos_to_pull = [repo for repo, status in zip(repos, statuses) if status.needs_pull]
-            elif mode == PullMode.SAFE:
-                repos_to_pull = [
-                    repo
-                    for repo, status in zip(repos, statuses)
-                    if status.needs_pull and not status.has_conflict_risk
-                ]
-            else:
-                # SMART: safe repos + conflict-risk repos with no file overlap
-                safe: list[GitRepository] = []
-                needs_check: list[GitRepository] = []
-                for repo, status in zip(repos, statuses):
-                    if not status.needs_pull:
-                        continue
-                    if not status.has_conflict_risk:
-                        safe.append(repo)
-                    else:
-                        needs_check.append(repo)
-                if needs_check:
-                    if sequential or len(needs_check) <= 1:
-                        for repo in needs_check:
-                            if not repo.has_file_conflicts():
-                                safe.append(repo)
-                    else:
-                        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                            futures = {
-                                executor.submit(repo.has_file_conflicts): repo
-                                for repo in needs_check
-                            }
-                            for future in as_completed(futures):
-                                if not future.result():
-                                    safe.append(futures[future])
-                repos_to_pull = safe
+                statuses = self._get_pull_statuses(mode, sequential)
+            repos_to_pull = self._select_repos_to_pull(repos, statuses, mode, sequential)
         else:
             repos_to_pull = repos
 
         if dry_run:
-            return [
-                OperationResult(
-                    path=repo.path,
-                    name=repo.name,
-                    success=True,
-                    operation="pull",
-                    message="Would pull (dry-run)",
-                )
-                for repo in repos_to_pull
-            ]
+            return _dry_run_results(repos_to_pull, "pull")
 
         return self._execute_parallel(
             lambda repo: repo.pull(),
@@ -1149,6 +1729,44 @@ class FleetManager:
             sequential=sequential,
         )
 
+    def _get_pull_statuses(self, mode: PullMode, sequential: bool) -> list[RepositoryStatus]:
+        """Fetch and get the statuses pull selection needs under ``mode``.
+
+        FORCE only looks at ahead/behind; SAFE and SMART also need the
+        working-tree counts for the conflict-risk check.
+        """
+        if mode == PullMode.FORCE:
+            return self.get_all_sync_status(fetch_first=True, sequential=sequential)
+        return self.get_all_status(
+            fetch_first=True, sequential=sequential, include_branch_summary=False
+        )
+
+    def _select_repos_to_pull(
+        self,
+        repos: list[GitRepository],
+        statuses: list[RepositoryStatus],
+        mode: PullMode,
+        sequential: bool,
+    ) -> list[GitRepository]:
+        """Pick the repositories that are behind and safe to pull under ``mode``."""
+        if mode == PullMode.FORCE:
+            return [repo for repo, status in zip(repos, statuses) if status.needs_pull]
+        if mode == PullMode.SAFE:
+            return [
+                repo
+                for repo, status in zip(repos, statuses)
+                if status.needs_pull and not status.has_conflict_risk
+            ]
+
+        # SMART: safe repos + conflict-risk repos with no file overlap
+        candidates = [(repo, status) for repo, status in zip(repos, statuses) if status.needs_pull]
+        needs_check = [repo for repo, status in candidates if status.has_conflict_risk]
+        conflicts = self._execute_parallel(
+            lambda repo: repo.has_file_conflicts(), repos=needs_check, sequential=sequential
+        )
+        conflicting = {repo.path for repo, conflict in zip(needs_check, conflicts) if conflict}
+        return [repo for repo, _ in candidates if repo.path not in conflicting]
+
     def push_all(
         self,
         only_ahead: bool = True,
@@ -1161,22 +1779,13 @@ class FleetManager:
 
         if only_ahead:
             if statuses is None:
-                statuses = self.get_all_status(fetch_first=True, sequential=sequential)
+                statuses = self.get_all_sync_status(fetch_first=True, sequential=sequential)
             repos_to_push = [repo for repo, status in zip(repos, statuses) if status.needs_push]
         else:
             repos_to_push = repos
 
         if dry_run:
-            return [
-                OperationResult(
-                    path=repo.path,
-                    name=repo.name,
-                    success=True,
-                    operation="push",
-                    message="Would push (dry-run)",
-                )
-                for repo in repos_to_push
-            ]
+            return _dry_run_results(repos_to_push, "push")
 
         return self._execute_parallel(
             lambda repo: repo.push(),
@@ -1242,7 +1851,7 @@ class FleetManager:
     ) -> list[RepositoryDiff]:
         """Get file-level diff for all repositories."""
         results = self._execute_parallel(
-            lambda repo: repo.get_diff(),
+            lambda repo: repo.get_diff(skip_clean=dirty_only),
             sequential=sequential,
             on_repo_done=on_repo_done,
         )
@@ -1251,20 +1860,36 @@ class FleetManager:
         return results
 
 
+def _dry_run_results(repos: list[GitRepository], operation: str) -> list[OperationResult]:
+    """Build the results reported for a dry-run pull or push."""
+    return [
+        OperationResult(
+            path=repo.path,
+            name=repo.name,
+            success=True,
+            operation=operation,
+            message=f"Would {operation} (dry-run)",
+        )
+        for repo in repos
+    ]
+
+
 def get_global_identity() -> GlobalIdentity:
     """Get global Git identity configuration."""
     try:
         name_result = subprocess.run(
-            ["git", "config", "--global", "user.name"],
+            [_GIT_EXECUTABLE, "config", "--global", "user.name"],
             capture_output=True,
             text=True,
             check=False,
+            close_fds=False,
         )
         email_result = subprocess.run(
-            ["git", "config", "--global", "user.email"],
+            [_GIT_EXECUTABLE, "config", "--global", "user.email"],
             capture_output=True,
             text=True,
             check=False,
+            close_fds=False,
         )
         return GlobalIdentity(
             user_name=name_result.stdout.strip() if name_result.returncode == 0 else "",
@@ -1292,7 +1917,7 @@ def load_roots_file(roots_file: Path) -> list[Path]:
                     # Expand environment variables first, then tilde
                     expanded = os.path.expandvars(line)
                     path = Path(expanded).expanduser()
-                    if path.exists() and path.is_dir():
+                    if path.is_dir():
                         roots.append(path)
     except FileNotFoundError:
         pass
@@ -1310,15 +1935,15 @@ def resolve_roots_file() -> Path | None:
     env_roots = os.environ.get("GIT_FLEET_ROOTS")
     if env_roots:
         env_path = Path(env_roots).expanduser()
-        if env_path.exists() and env_path.is_file():
+        if env_path.is_file():
             return env_path
 
     xdg_path = Path.home() / ".config" / "git-fleet" / "roots"
-    if xdg_path.exists() and xdg_path.is_file():
+    if xdg_path.is_file():
         return xdg_path
 
     legacy_path = Path.home() / ".git-fleet-roots"
-    if legacy_path.exists() and legacy_path.is_file():
+    if legacy_path.is_file():
         return legacy_path
 
     return None
@@ -1343,6 +1968,7 @@ class MultiRootFleetManager:
                 max_workers,
                 include_no_remote=include_no_remote,
                 include_detached=include_detached,
+                _resolved=True,
             )
             for root in self.roots
         }
@@ -1351,37 +1977,41 @@ class MultiRootFleetManager:
         self,
         operation: Callable[[GitRepository], Any],
         *,
+        root_repos: list[tuple[Path, list[GitRepository]]] | None = None,
         sequential: bool = False,
         on_repo_done: Callable[[], None] | None = None,
     ) -> list[tuple[Path, list[Any]]]:
-        """Execute a repository operation across all roots with one worker pool."""
-        root_repos = [
-            (root, fleet.discover_repositories()) for root, fleet in self._fleet_managers.items()
-        ]
-        results_by_root: dict[Path, list[Any]] = {root: [] for root, _ in root_repos}
+        """Execute a repository operation across all roots with one worker pool.
 
+        Runs on every discovered repository unless ``root_repos`` narrows it.
+        """
+        if root_repos is None:
+            root_repos = self.discover_all_repositories()
         if sequential:
+            all_results = []
             for root, repos in root_repos:
+                results = []
                 for repo in repos:
-                    results_by_root[root].append(operation(repo))
-                    if on_repo_done:
-                        on_repo_done()
-        else:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {
-                    executor.submit(operation, repo): root
-                    for root, repos in root_repos
-                    for repo in repos
-                }
-                for future in as_completed(futures):
-                    results_by_root[futures[future]].append(future.result())
+                    results.append(operation(repo))
                     if on_repo_done:
                         on_repo_done()
-
-        for results in results_by_root.values():
-            results.sort(key=lambda r: r.path if hasattr(r, "path") else str(r))
-
-        return [(root, results_by_root[root]) for root, _ in root_repos]
+                all_results.append((root, results))
+            return all_results
+
+        # Each result lands at its (root, repository) index, keeping discovery order
+        all_results = [(root, [None] * len(repos)) for root, repos in root_repos]
+        executor = _get_executor(self.max_workers)
+        futures = {
+            executor.submit(operation, repo): (results, i)
+            for (_, results), (_, repos) in zip(all_results, root_repos)
+            for i, repo in enumerate(repos)
+        }
+        for future in as_completed(futures):
+            results, i = futures[future]
+            results[i] = future.result()
+            if on_repo_done:
+                on_repo_done()
+        return all_results
 
     def get_all_identities(
         self,
@@ -1389,11 +2019,11 @@ class MultiRootFleetManager:
         on_repo_done: Callable[[], None] | None = None,
     ) -> list[tuple[Path, list[RepositoryIdentity]]]:
         """Get identity configuration for all repositories across all roots."""
-        results = []
-        for root, fleet in self._fleet_managers.items():
-            identities = fleet.get_all_identities(sequential=sequential, on_repo_done=on_repo_done)
-            results.append((root, identities))
-        return results
+        return self._execute_repo_operation_across_roots(
+            lambda repo: repo.get_identity(),
+            sequential=sequential,
+            on_repo_done=on_repo_done,
+        )
 
     def get_all_remotes(
         self,
@@ -1401,11 +2031,11 @@ class MultiRootFleetManager:
         on_repo_done: Callable[[], None] | None = None,
     ) -> list[tuple[Path, list[RepositoryRemotes]]]:
         """Get remote configuration for all repositories across all roots."""
-        results = []
-        for root, fleet in self._fleet_managers.items():
-            remotes = fleet.get_all_remotes(sequential=sequential, on_repo_done=on_repo_done)
-            results.append((root, remotes))
-        return results
+        return self._execute_repo_operation_across_roots(
+            lambda repo: repo.get_remotes(),
+            sequential=sequential,
+            on_repo_done=on_repo_done,
+        )
 
     def get_all_diff(
         self,
@@ -1414,12 +2044,13 @@ class MultiRootFleetManager:
         on_repo_done: Callable[[], None] | None = None,
     ) -> list[tuple[Path, list[RepositoryDiff]]]:
         """Get file-level diff for all repositories across all roots."""
-        results = []
-        for root, fleet in self._fleet_managers.items():
-            diffs = fleet.get_all_diff(
-                sequential=sequential, dirty_only=dirty_only, on_repo_done=on_repo_done
-            )
-            results.append((root, diffs))
+        results = self._execute_repo_operation_across_roots(
+            lambda repo: repo.get_diff(skip_clean=dirty_only),
+            sequential=sequential,
+            on_repo_done=on_repo_done,
+        )
+        if dirty_only:
+            results = [(root, [d for d in diffs if d.is_dirty]) for root, diffs in results]
         return results
 
     def get_all_status(
@@ -1427,14 +2058,66 @@ class MultiRootFleetManager:
         fetch_first: bool = True,
         sequential: bool = False,
         on_repo_done: Callable[[], None] | None = None,
+        *,
+        include_branch_summary: bool = True,
+        untracked: UntrackedMode | None = None,
     ) -> list[tuple[Path, list[RepositoryStatus]]]:
         """Get status for all repositories across all roots."""
         return self._execute_repo_operation_across_roots(
-            lambda repo: repo.get_status(fetch_first=fetch_first),
+            lambda repo: repo.get_status(
+                fetch_first=fetch_first,
+                include_branch_summary=include_branch_summary,
+                untracked=untracked,
+            ),
             sequential=sequential,
             on_repo_done=on_repo_done,
         )
 
+    def refresh_statuses(
+        self,
+        all_statuses: list[tuple[Path, list[RepositoryStatus]]],
+        all_results: list[tuple[Path, list[OperationResult]]],
+        sequential: bool = False,
+        on_repo_done: Callable[[], None] | None = None,
+    ) -> list[tuple[Path, list[RepositoryStatus]]]:
+        """Re-read status only for the repositories an operation touched, across roots."""
+        touched = {result.path for _, results in all_results for result in results}
+        root_repos = [
+            (root, [repo for repo in repos if repo.path in touched])
+            for root, repos in self.discover_all_repositories()
+        ]
+        if on_repo_done:
+            untouched = sum(len(statuses) for _, statuses in all_statuses) - sum(
+                len(repos) for _, repos in root_repos
+            )
+            for _ in range(untouched):
+                on_repo_done()
+        refreshed = {
+            status.path: status
+            for _, statuses in self._execute_repo_operation_across_roots(
+                lambda repo: repo.get_status(),
+                root_repos=root_repos,
+                sequential=sequential,
+                on_repo_done=on_repo_done,
+            )
+            for status in statuses
+        }
+        return [
+            (root, [refreshed.get(status.path, status) for status in statuses])
+            for root, statuses in all_statuses
+        ]
+
+    def get_all_sync_status(
+        self,
+        fetch_first: bool = True,
+        sequential: bool = False,
+    ) -> list[tuple[Path, list[RepositoryStatus]]]:
+        """Get branch and ahead/behind status across all roots (no working-tree scan)."""
+        return self._execute_repo_operation_across_roots(
+            lambda repo: repo.get_sync_status(fetch_first=fetch_first),
+            sequential=sequential,
+        )
+
     def discover_all_repositories(self) -> list[tuple[Path, list[GitRepository]]]:
         """Discover all repositories across all roots."""
         results = []
@@ -1458,6 +2141,15 @@ class MultiRootFleetManager:
             on_repo_done=on_repo_done,
         )
 
+    def enable_status_caches(
+        self, sequential: bool = False
+    ) -> list[tuple[Path, list[OperationResult]]]:
+        """Enable untracked cache / fsmonitor in all repositories across all roots."""
+        return self._execute_repo_operation_across_roots(
+            lambda repo: repo.enable_status_caches(),
+            sequential=sequential,
+        )
+
     def pull_all(
         self,
         only_behind: bool = True,
@@ -1467,21 +2159,31 @@ class MultiRootFleetManager:
         all_statuses: list[tuple[Path, list[RepositoryStatus]]] | None = None,
     ) -> list[tuple[Path, list[OperationResult]]]:
         """Pull all repositories across all roots."""
-        statuses_by_root: dict[Path, list[RepositoryStatus]] = {}
-        if all_statuses is not None:
-            statuses_by_root = {root: statuses for root, statuses in all_statuses}
+        if only_behind and all_statuses is None:
+            if mode == PullMode.FORCE:
+                all_statuses = self.get_all_sync_status(fetch_first=True, sequential=sequential)
+            else:
+                all_statuses = self.get_all_status(
+                    fetch_first=True, sequential=sequential, include_branch_summary=False
+                )
+        statuses_by_root = dict(all_statuses) if all_statuses is not None else {}
 
-        results = []
+        root_repos = []
         for root, fleet in self._fleet_managers.items():
-            pull_results = fleet.pull_all(
-                only_behind=only_behind,
-                sequential=sequential,
-                dry_run=dry_run,
-                mode=mode,
-                statuses=statuses_by_root.get(root),
-            )
-            results.append((root, pull_results))
-        return results
+            repos = fleet.discover_repositories()
+            if only_behind:
+                statuses = statuses_by_root.get(root)
+                if statuses is None:
+                    statuses = fleet._get_pull_statuses(mode, sequential)
+                repos = fleet._select_repos_to_pull(repos, statuses, mode, sequential)
+            root_repos.append((root, repos))
+
+        if dry_run:
+            return [(root, _dry_run_results(repos, "pull")) for root, repos in root_repos]
+
+        return self._execute_repo_operation_across_roots(
+            lambda repo: repo.pull(), root_repos=root_repos, sequential=sequential
+        )
 
     def push_all(
         self,
@@ -1491,20 +2193,26 @@ class MultiRootFleetManager:
         all_statuses: list[tuple[Path, list[RepositoryStatus]]] | None = None,
     ) -> list[tuple[Path, list[OperationResult]]]:
         """Push all repositories across all roots."""
-        statuses_by_root: dict[Path, list[RepositoryStatus]] = {}
-        if all_statuses is not None:
-            statuses_by_root = {root: statuses for root, statuses in all_statuses}
+        if only_ahead and all_statuses is None:
+            all_statuses = self.get_all_sync_status(fetch_first=True, sequential=sequential)
+        statuses_by_root = dict(all_statuses) if all_statuses is not None else {}
 
-        results = []
+        root_repos = []
         for root, fleet in self._fleet_managers.items():
-            push_results = fleet.push_all(
-                only_ahead=only_ahead,
-                sequential=sequential,
-                dry_run=dry_run,
-                statuses=statuses_by_root.get(root),
-            )
-            results.append((root, push_results))
-        return results
+            repos = fleet.discover_repositories()
+            if only_ahead:
+                statuses = statuses_by_root.get(root)
+                if statuses is None:
+                    statuses = fleet.get_all_sync_status(fetch_first=True, sequential=sequential)
+                repos = [repo for repo, status in zip(repos, statuses) if status.needs_push]
+            root_repos.append((root, repos))
+
+        if dry_run:
+            return [(root, _dry_run_results(repos, "push")) for root, repos in root_repos]
+
+        return self._execute_repo_operation_across_roots(
+            lambda repo: repo.push(), root_repos=root_repos, sequential=sequential
+        )
 
     def get_summary(self, all_statuses: list[tuple[Path, list[RepositoryStatus]]]) -> FleetSummary:
         """Generate combined summary from all statuses."""
@@ -1574,7 +2282,7 @@ def main(
 ):
     """git-fleet: Command multiple Git repositories like a fleet admiral."""
     if schema:
-        print(json.dumps(get_tool_schema(), indent=2))
+        print(get_tool_schema_json(indent=2))
         raise typer.Exit()
 
     # If no command and no schema, show help
@@ -1592,6 +2300,9 @@ def get_console_and_formatter(json_output: bool) -> tuple[Console, OutputFormatt
 
 def _create_progress_bar(console: Console) -> Progress:
     """Create a progress bar with bar, count, and percentage columns."""
+    # rich.progress is imported on first use: --json and list runs never need it
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+
     return Progress(
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
@@ -1601,6 +2312,29 @@ def _create_progress_bar(console: Console) -> Progress:
     )
 
 
+@contextmanager
+def _spinner(console: Console, description: str) -> Iterator[None]:
+    """Show an indeterminate spinner with description while the block runs."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    # A spinner has no per-repo updates to show; 10 Hz is plenty and halves redraws
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        refresh_per_second=10,
+    ) as progress:
+        progress.add_task(description, total=None)
+        yield
+
+
+def _per_root_dicts(per_root: list[tuple[Path, list[Any]]], key: str) -> list[dict]:
+    """Serialize (root, items) pairs as [{"root": ..., key: [item.to_dict(), ...]}]."""
+    return [
+        {"root": str(root), key: [item.to_dict() for item in items]} for root, items in per_root
+    ]
+
+
 def _print_success_bullets(console: Console, results: list[OperationResult]) -> None:
     """Print successful repository names as a dim bullet list.
 
@@ -1612,6 +2346,14 @@ def _print_success_bullets(console: Console, results: list[OperationResult]) ->
             console.print(f"    [dim]• {r.name}[/]")
 
 
+def _print_fsmonitor_errors(console: Console, failed: list[OperationResult]) -> None:
+    """Warn about repositories where --enable-fsmonitor could not set the config."""
+    for r in failed:
+        console.print(f"[yellow]⚠ {r.name}: could not enable status caches: {r.error}[/]")
+    if failed:
+        console.print()
+
+
 @app.command()
 def status(
     path: Path = typer.Argument(
@@ -1657,6 +2399,17 @@ def status(
         "-d",
         help=("Show only repositories not clean and in sync (display filter; ignored with --json)"),
     ),
+    enable_fsmonitor: bool = typer.Option(
+        False,
+        "--enable-fsmonitor",
+        help="Enable core.untrackedCache (and core.fsmonitor where supported) in each repository",
+    ),
+    untracked: UntrackedMode = typer.Option(
+        None,
+        "--untracked-files",
+        "-u",
+        help="Untracked file scan: no (fastest, untracked not counted), normal, or all",
+    ),
 ):
     """Show status of all repositories."""
     console, formatter = get_console_and_formatter(json_output)
@@ -1674,6 +2427,16 @@ def status(
             include_no_remote=include_no_remote,
             include_detached=include_detached,
         )
+        fsmonitor_errors = None
+        if enable_fsmonitor:
+            fsmonitor_errors = [
+                r
+                for _, results in multi_fleet.enable_status_caches(sequential=sequential)
+                for r in results
+                if not r.success
+            ]
+            if not json_output:
+                _print_fsmonitor_errors(console, fsmonitor_errors)
 
         if not json_output:
             all_repos = multi_fleet.discover_all_repositories()
@@ -1709,14 +2472,19 @@ def status(
                     fetch_first=False,
                     sequential=sequential,
                     on_repo_done=lambda: progress.advance(task),
+                    untracked=untracked,
                 )
         else:
             if not no_fetch:
                 multi_fleet.fetch_all(sequential=sequential)
-            all_statuses = multi_fleet.get_all_status(fetch_first=False, sequential=sequential)
+            all_statuses = multi_fleet.get_all_status(
+                fetch_first=False, sequential=sequential, untracked=untracked
+            )
 
         summary = multi_fleet.get_summary(all_statuses)
-        formatter.print_multi_root_status_list(all_statuses, summary, dirty_only=dirty_only)
+        formatter.print_multi_root_status_list(
+            all_statuses, summary, dirty_only=dirty_only, fsmonitor_errors=fsmonitor_errors
+        )
     else:
         # Single root mode
         target_path = path if path else Path(".")
@@ -1725,14 +2493,16 @@ def status(
             include_no_remote=include_no_remote,
             include_detached=include_detached,
         )
+        fsmonitor_errors = None
+        if enable_fsmonitor:
+            fsmonitor_errors = [
+                r for r in fleet.enable_status_caches(sequential=sequential) if not r.success
+            ]
+            if not json_output:
+                _print_fsmonitor_errors(console, fsmonitor_errors)
 
         if not json_output:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Scanning repositories...", total=None)
+            with _spinner(console, "Scanning repositories..."):
                 repos = fleet.discover_repositories()
 
             console.print(f"Found [bold]{len(repos)}[/] repositories\n")
@@ -1762,6 +2532,7 @@ def status(
                     fetch_first=False,
                     sequential=sequential,
                     on_repo_done=lambda: progress.advance(task),
+                    untracked=untracked,
                 )
         else:
             repos = fleet.discover_repositories()
@@ -1770,10 +2541,17 @@ def status(
             statuses = fleet.get_all_status(
                 fetch_first=False,
                 sequential=sequential,
+                untracked=untracked,
             )
 
         summary = fleet.get_summary(statuses)
-        formatter.print_status_list(statuses, summary, target_path.resolve(), dirty_only=dirty_only)
+        formatter.print_status_list(
+            statuses,
+            summary,
+            fleet.root_path,
+            dirty_only=dirty_only,
+            fsmonitor_errors=fsmonitor_errors,
+        )
 
 
 @app.command()
@@ -1794,6 +2572,13 @@ def fetch(
         "-s",
         help="Run sequentially instead of parallel",
     ),
+    jobs: int = typer.Option(
+        DEFAULT_MAX_WORKERS,
+        "--jobs",
+        "-J",
+        min=1,
+        help="Maximum number of repositories to fetch in parallel",
+    ),
     roots: Path = typer.Option(
         None,
         "--roots",
@@ -1824,6 +2609,7 @@ def fetch(
 
         multi_fleet = MultiRootFleetManager(
             root_paths,
+            max_workers=jobs,
             include_no_remote=include_no_remote,
             include_detached=include_detached,
         )
@@ -1846,6 +2632,7 @@ def fetch(
         target_path = path if path else Path(".")
         fleet = FleetManager(
             target_path,
+            max_workers=jobs,
             include_no_remote=include_no_remote,
             include_detached=include_detached,
         )
@@ -1956,12 +2743,7 @@ def pull(
         )
 
         if not json_output:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Pulling repositories...", total=None)
+            with _spinner(console, "Pulling repositories..."):
                 all_results = multi_fleet.pull_all(
                     only_behind=not all_repos,
                     sequential=sequential,
@@ -1986,9 +2768,12 @@ def pull(
             include_detached=include_detached,
         )
 
-        # In safe mode, show conflict warnings upfront
+        # In safe mode, show conflict warnings upfront (and reuse the statuses for the pull)
+        statuses = None
         if mode == PullMode.SAFE and not all_repos:
-            statuses = fleet.get_all_status(fetch_first=True, sequential=sequential)
+            statuses = fleet.get_all_status(
+                fetch_first=True, sequential=sequential, include_branch_summary=False
+            )
             conflict_repos = [s for s in statuses if s.has_conflict_risk and s.needs_pull]
 
             if conflict_repos and not json_output:
@@ -2007,17 +2792,13 @@ def pull(
                 )
 
         if not json_output:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Pulling repositories...", total=None)
+            with _spinner(console, "Pulling repositories..."):
                 results = fleet.pull_all(
                     only_behind=not all_repos,
                     sequential=sequential,
                     dry_run=dry_run,
                     mode=mode,
+                    statuses=statuses,
                 )
         else:
             results = fleet.pull_all(
@@ -2025,6 +2806,7 @@ def pull(
                 sequential=sequential,
                 dry_run=dry_run,
                 mode=mode,
+                statuses=statuses,
             )
 
         formatter.print_operation_results(results, "pull")
@@ -2095,12 +2877,7 @@ def push(
         )
 
         if not json_output:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Pushing repositories...", total=None)
+            with _spinner(console, "Pushing repositories..."):
                 all_results = multi_fleet.push_all(
                     only_ahead=not all_repos,
                     sequential=sequential,
@@ -2124,12 +2901,7 @@ def push(
         )
 
         if not json_output:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                progress.add_task("Pushing repositories...", total=None)
+            with _spinner(console, "Pushing repositories..."):
                 results = fleet.push_all(
                     only_ahead=not all_repos,
                     sequential=sequential,
@@ -2229,7 +3001,6 @@ def sync(
             include_no_remote=include_no_remote,
             include_detached=include_detached,
         )
-        all_results = {"fetch": [], "pull": [], "push": []}
         all_repos = multi_fleet.discover_all_repositories()
         repo_total = sum(len(repos) for _, repos in all_repos)
 
@@ -2238,29 +3009,30 @@ def sync(
             console.print("[bold]Step 1/4: Fetching all repositories...[/]")
             with _create_progress_bar(console) as progress:
                 task = progress.add_task("  Fetching...", total=repo_total)
-                fetch_results = multi_fleet.fetch_all(
+                all_fetch_results = multi_fleet.fetch_all(
                     sequential=sequential,
                     on_repo_done=lambda: progress.advance(task),
                     all_remotes=all_remotes,
                     prune=prune,
                 )
         else:
-            fetch_results = multi_fleet.fetch_all(
+            all_fetch_results = multi_fleet.fetch_all(
                 sequential=sequential,
                 all_remotes=all_remotes,
                 prune=prune,
             )
-        all_results["fetch"] = fetch_results
 
         if not json_output:
-            total = sum(len(results) for _, results in fetch_results)
-            success = sum(sum(1 for r in results if r.success) for _, results in fetch_results)
+            total = sum(len(results) for _, results in all_fetch_results)
+            success = sum(sum(1 for r in results if r.success) for _, results in all_fetch_results)
             console.print(f"  Fetched {success}/{total} repositories")
-            failed = [r for _, results in fetch_results for r in results if not r.success]
+            failed = [r for _, results in all_fetch_results for r in results if not r.success]
             if failed:
                 for r in failed:
                     console.print(f"    [red]✗ {r.name}: {r.error}[/]")
-            warned = [r for _, results in fetch_results for r in results if r.success and r.warning]
+            warned = [
+                r for _, results in all_fetch_results for r in results if r.success and r.warning
+            ]
             if warned:
                 for r in warned:
                     console.print(f"    [yellow]⚠ {r.name}: {r.warning}[/]")
@@ -2270,41 +3042,42 @@ def sync(
         if not json_output:
             with _create_progress_bar(console) as progress:
                 task = progress.add_task("  Analyzing...", total=repo_total)
-                pre_statuses = multi_fleet.get_all_status(
+                all_pre_statuses = multi_fleet.get_all_status(
                     fetch_first=False,
                     sequential=sequential,
                     on_repo_done=lambda: progress.advance(task),
                 )
         else:
-            pre_statuses = multi_fleet.get_all_status(fetch_first=False, sequential=sequential)
+            all_pre_statuses = multi_fleet.get_all_status(fetch_first=False, sequential=sequential)
 
         # Step 2: Pull (smart) - reuse pre-fetched statuses
         if not json_output:
             console.print("[bold]Step 2/4: Pulling repositories (smart)...[/]")
 
-        pull_results = multi_fleet.pull_all(
+        all_pull_results = multi_fleet.pull_all(
             only_behind=True,
             sequential=sequential,
             dry_run=dry_run,
-            all_statuses=pre_statuses,
+            all_statuses=all_pre_statuses,
         )
-        all_results["pull"] = pull_results
 
         if not json_output:
-            total = sum(len(results) for _, results in pull_results)
+            total = sum(len(results) for _, results in all_pull_results)
             if total > 0:
-                success = sum(sum(1 for r in results if r.success) for _, results in pull_results)
+                success = sum(
+                    sum(1 for r in results if r.success) for _, results in all_pull_results
+                )
                 console.print(f"  Pulled {success}/{total} repositories")
                 _print_success_bullets(
                     console,
-                    [r for _, results in pull_results for r in results],
+                    [r for _, results in all_pull_results for r in results],
                 )
-                failed = [r for _, results in pull_results for r in results if not r.success]
+                failed = [r for _, results in all_pull_results for r in results if not r.success]
                 if failed:
                     for r in failed:
                         console.print(f"    [red]✗ {r.name}: {r.error}[/]")
                 warned = [
-                    r for _, results in pull_results for r in results if r.success and r.warning
+                    r for _, results in all_pull_results for r in results if r.success and r.warning
                 ]
                 if warned:
                     for r in warned:
@@ -2313,42 +3086,44 @@ def sync(
             else:
                 console.print("  No repositories needed pulling\n")
 
-        # Re-check status after pull (no fetch needed, pull changed ahead/behind)
+        # Re-check only the pulled repositories (no fetch needed, pull changed ahead/behind)
         if not json_output:
             with _create_progress_bar(console) as progress:
                 task = progress.add_task("  Analyzing...", total=repo_total)
-                post_pull_statuses = multi_fleet.get_all_status(
-                    fetch_first=False,
+                all_post_pull_statuses = multi_fleet.refresh_statuses(
+                    all_pre_statuses,
+                    all_pull_results,
                     sequential=sequential,
                     on_repo_done=lambda: progress.advance(task),
                 )
         else:
-            post_pull_statuses = multi_fleet.get_all_status(
-                fetch_first=False, sequential=sequential
+            all_post_pull_statuses = multi_fleet.refresh_statuses(
+                all_pre_statuses, all_pull_results, sequential=sequential
             )
 
         # Step 3: Push - reuse post-pull statuses
         if not json_output:
             console.print("[bold]Step 3/4: Pushing repositories...[/]")
 
-        push_results = multi_fleet.push_all(
+        all_push_results = multi_fleet.push_all(
             only_ahead=True,
             sequential=sequential,
             dry_run=dry_run,
-            all_statuses=post_pull_statuses,
+            all_statuses=all_post_pull_statuses,
         )
-        all_results["push"] = push_results
 
         if not json_output:
-            total = sum(len(results) for _, results in push_results)
+            total = sum(len(results) for _, results in all_push_results)
             if total > 0:
-                success = sum(sum(1 for r in results if r.success) for _, results in push_results)
+                success = sum(
+                    sum(1 for r in results if r.success) for _, results in all_push_results
+                )
                 console.print(f"  Pushed {success}/{total} repositories")
                 _print_success_bullets(
                     console,
-                    [r for _, results in push_results for r in results],
+                    [r for _, results in all_push_results for r in results],
                 )
-                failed = [r for _, results in push_results for r in results if not r.success]
+                failed = [r for _, results in all_push_results for r in results if not r.success]
                 if failed:
                     for r in failed:
                         console.print(f"    [red]✗ {r.name}: {r.error}[/]")
@@ -2360,15 +3135,16 @@ def sync(
             console.print("[bold]Step 4/4: Checking final status...[/]")
             with _create_progress_bar(console) as progress:
                 task = progress.add_task("  Checking...", total=repo_total)
-                all_statuses = multi_fleet.get_all_status(
-                    fetch_first=False,
+                all_statuses = multi_fleet.refresh_statuses(
+                    all_post_pull_statuses,
+                    all_push_results,
                     sequential=sequential,
                     on_repo_done=lambda: progress.advance(task),
                 )
             console.print()
             summary = multi_fleet.get_summary(all_statuses)
             sync_summary = SyncOperationSummary.from_multi_root_results(
-                fetch_results, pull_results, push_results
+                all_fetch_results, all_pull_results, all_push_results
             )
             formatter.print_multi_root_status_list(
                 all_statuses, summary, sync_summary, dirty_only=dirty_only
@@ -2379,33 +3155,23 @@ def sync(
                     f"\n[bold red]⚠ {summary.conflict_risk} repositories need manual attention[/]"
                 )
         else:
-            all_statuses = multi_fleet.get_all_status(fetch_first=False, sequential=sequential)
+            all_statuses = multi_fleet.refresh_statuses(
+                all_post_pull_statuses, all_push_results, sequential=sequential
+            )
             summary = multi_fleet.get_summary(all_statuses)
             sync_summary = SyncOperationSummary.from_multi_root_results(
-                fetch_results, pull_results, push_results
+                all_fetch_results, all_pull_results, all_push_results
             )
 
             output = {
-                "fetch": [
-                    {"root": str(root), "results": [r.to_dict() for r in results]}
-                    for root, results in fetch_results
-                ],
-                "pull": [
-                    {"root": str(root), "results": [r.to_dict() for r in results]}
-                    for root, results in pull_results
-                ],
-                "push": [
-                    {"root": str(root), "results": [r.to_dict() for r in results]}
-                    for root, results in push_results
-                ],
-                "status": [
-                    {"root": str(root), "statuses": [s.to_dict() for s in statuses]}
-                    for root, statuses in all_statuses
-                ],
+                "fetch": _per_root_dicts(all_fetch_results, "results"),
+                "pull": _per_root_dicts(all_pull_results, "results"),
+                "push": _per_root_dicts(all_push_results, "results"),
+                "status": _per_root_dicts(all_statuses, "statuses"),
                 "summary": summary.to_dict(),
                 "sync_operations": sync_summary.to_dict(),
             }
-            console.print(json.dumps(output, indent=2))
+            write_json(console, output)
         return
 
     # Single root mode
@@ -2417,7 +3183,6 @@ def sync(
         include_detached=include_detached,
     )
 
-    all_results = []
     repos = fleet.discover_repositories()
     repo_total = len(repos)
 
@@ -2438,7 +3203,6 @@ def sync(
             all_remotes=all_remotes,
             prune=prune,
         )
-    all_results.extend(fetch_results)
 
     if not json_output:
         success = sum(1 for r in fetch_results if r.success)
@@ -2475,7 +3239,6 @@ def sync(
         dry_run=dry_run,
         statuses=pre_statuses,
     )
-    all_results.extend(pull_results)
 
     if not json_output:
         if pull_results:
@@ -2494,17 +3257,20 @@ def sync(
         else:
             console.print("  No repositories needed pulling\n")
 
-    # Re-check status after pull (no fetch needed, pull changed ahead/behind)
+    # Re-check only the pulled repositories (no fetch needed, pull changed ahead/behind)
     if not json_output:
         with _create_progress_bar(console) as progress:
             task = progress.add_task("  Analyzing...", total=repo_total)
-            post_pull_statuses = fleet.get_all_status(
-                fetch_first=False,
+            post_pull_statuses = fleet.refresh_statuses(
+                pre_statuses,
+                pull_results,
                 sequential=sequential,
                 on_repo_done=lambda: progress.advance(task),
             )
     else:
-        post_pull_statuses = fleet.get_all_status(fetch_first=False, sequential=sequential)
+        post_pull_statuses = fleet.refresh_statuses(
+            pre_statuses, pull_results, sequential=sequential
+        )
 
     # Step 3: Push - reuse post-pull statuses
     if not json_output:
@@ -2516,7 +3282,6 @@ def sync(
         dry_run=dry_run,
         statuses=post_pull_statuses,
     )
-    all_results.extend(push_results)
 
     if not json_output:
         if push_results:
@@ -2535,8 +3300,9 @@ def sync(
         console.print("[bold]Step 4/4: Checking final status...[/]")
         with _create_progress_bar(console) as progress:
             task = progress.add_task("  Checking...", total=repo_total)
-            statuses = fleet.get_all_status(
-                fetch_first=False,
+            statuses = fleet.refresh_statuses(
+                post_pull_statuses,
+                push_results,
                 sequential=sequential,
                 on_repo_done=lambda: progress.advance(task),
             )
@@ -2544,7 +3310,7 @@ def sync(
         summary = fleet.get_summary(statuses)
         sync_summary = SyncOperationSummary.from_results(fetch_results, pull_results, push_results)
         formatter.print_status_list(
-            statuses, summary, target_path.resolve(), sync_summary, dirty_only=dirty_only
+            statuses, summary, fleet.root_path, sync_summary, dirty_only=dirty_only
         )
 
         if summary.conflict_risk > 0:
@@ -2552,7 +3318,7 @@ def sync(
                 f"\n[bold red]⚠ {summary.conflict_risk} repositories need manual attention[/]"
             )
     else:
-        statuses = fleet.get_all_status(fetch_first=False, sequential=sequential)
+        statuses = fleet.refresh_statuses(post_pull_statuses, push_results, sequential=sequential)
         summary = fleet.get_summary(statuses)
         sync_summary = SyncOperationSummary.from_results(fetch_results, pull_results, push_results)
 
@@ -2564,7 +3330,7 @@ def sync(
             "summary": summary.to_dict(),
             "sync_operations": sync_summary.to_dict(),
         }
-        console.print(json.dumps(output, indent=2))
+        write_json(console, output)
 
 
 @app.command(name="list")
@@ -2631,9 +3397,9 @@ def list_repos(
                 print(repo.path)
         elif show_remote:
             remotes = fleet.get_all_remotes()
-            formatter.print_repo_list_with_remotes(repos, remotes, target_path.resolve())
+            formatter.print_repo_list_with_remotes(repos, remotes, fleet.root_path)
         else:
-            formatter.print_repo_list(repos, target_path.resolve())
+            formatter.print_repo_list(repos, fleet.root_path)
 
 
 @app.command()
@@ -2654,6 +3420,13 @@ def who(
         "-s",
         help="Run sequentially instead of parallel",
     ),
+    jobs: int = typer.Option(
+        DEFAULT_MAX_WORKERS,
+        "--jobs",
+        "-J",
+        min=1,
+        help="Maximum number of repositories to process in parallel",
+    ),
     roots: Path = typer.Option(
         None,
         "--roots",
@@ -2673,11 +3446,11 @@ def who(
             console.print(f"[red]Error: No valid roots found in {resolved_roots}[/]")
             raise typer.Exit(1)
 
-        multi_fleet = MultiRootFleetManager(root_paths)
+        multi_fleet = MultiRootFleetManager(root_paths, max_workers=jobs)
 
-        if not json_output:
-            all_repos = multi_fleet.discover_all_repositories()
-            total = sum(len(repos) for _, repos in all_repos)
+        all_repos = multi_fleet.discover_all_repositories()
+        total = sum(len(repos) for _, repos in all_repos)
+        if total and not json_output:
             with _create_progress_bar(console) as progress:
                 task = progress.add_task("Scanning...", total=total)
                 all_identities = multi_fleet.get_all_identities(
@@ -2691,10 +3464,10 @@ def who(
     else:
         # Single root mode
         target_path = path if path else Path(".")
-        fleet = FleetManager(target_path)
+        fleet = FleetManager(target_path, max_workers=jobs)
 
-        if not json_output:
-            repos = fleet.discover_repositories()
+        repos = fleet.discover_repositories()
+        if repos and not json_output:
             with _create_progress_bar(console) as progress:
                 task = progress.add_task("Scanning...", total=len(repos))
                 identities = fleet.get_all_identities(
@@ -2704,7 +3477,7 @@ def who(
         else:
             identities = fleet.get_all_identities(sequential=sequential)
 
-        formatter.print_identity_list(identities, global_identity, target_path.resolve())
+        formatter.print_identity_list(identities, global_identity, fleet.root_path)
 
 
 @app.command()
@@ -2725,6 +3498,13 @@ def diff(
         "-s",
         help="Run sequentially instead of parallel",
     ),
+    jobs: int = typer.Option(
+        DEFAULT_MAX_WORKERS,
+        "--jobs",
+        "-J",
+        min=1,
+        help="Maximum number of repositories to process in parallel",
+    ),
     all_repos: bool = typer.Option(
         False,
         "--all",
@@ -2760,14 +3540,15 @@ def diff(
 
         multi_fleet = MultiRootFleetManager(
             root_paths,
+            max_workers=jobs,
             include_no_remote=include_no_remote,
             include_detached=include_detached,
         )
 
-        if not json_output:
-            all_repos_discovered = multi_fleet.discover_all_repositories()
-            total = sum(len(repos) for _, repos in all_repos_discovered)
-            total_repos_per_root = {root: len(repos) for root, repos in all_repos_discovered}
+        all_repos_discovered = multi_fleet.discover_all_repositories()
+        total_repos_per_root = {root: len(repos) for root, repos in all_repos_discovered}
+        total = sum(total_repos_per_root.values())
+        if total and not json_output:
             with _create_progress_bar(console) as progress:
                 task = progress.add_task("Scanning...", total=total)
                 all_diffs = multi_fleet.get_all_diff(
@@ -2777,20 +3558,19 @@ def diff(
                 )
         else:
             all_diffs = multi_fleet.get_all_diff(sequential=sequential, dirty_only=not all_repos)
-            all_repos_discovered = multi_fleet.discover_all_repositories()
-            total_repos_per_root = {root: len(repos) for root, repos in all_repos_discovered}
 
         formatter.print_multi_root_diff_list(all_diffs, total_repos_per_root)
     else:
         target_path = path if path else Path(".")
         fleet = FleetManager(
             target_path,
+            max_workers=jobs,
             include_no_remote=include_no_remote,
             include_detached=include_detached,
         )
 
-        if not json_output:
-            repos = fleet.discover_repositories()
+        repos = fleet.discover_repositories()
+        if repos and not json_output:
             with _create_progress_bar(console) as progress:
                 task = progress.add_task("Scanning...", total=len(repos))
                 diffs = fleet.get_all_diff(
@@ -2799,10 +3579,9 @@ def diff(
                     on_repo_done=lambda: progress.advance(task),
                 )
         else:
-            repos = fleet.discover_repositories()
             diffs = fleet.get_all_diff(sequential=sequential, dirty_only=not all_repos)
 
-        formatter.print_diff_list(diffs, target_path.resolve(), len(repos))
+        formatter.print_diff_list(diffs, fleet.root_path, len(repos))
 
 
 @app.command()
@@ -2823,6 +3602,13 @@ def remote(
         "-s",
         help="Run sequentially instead of parallel",
     ),
+    jobs: int = typer.Option(
+        DEFAULT_MAX_WORKERS,
+        "--jobs",
+        "-J",
+        min=1,
+        help="Maximum number of repositories to process in parallel",
+    ),
     roots: Path = typer.Option(
         None,
         "--roots",
@@ -2841,11 +3627,11 @@ def remote(
             console.print(f"[red]Error: No valid roots found in {resolved_roots}[/]")
             raise typer.Exit(1)
 
-        multi_fleet = MultiRootFleetManager(root_paths)
+        multi_fleet = MultiRootFleetManager(root_paths, max_workers=jobs)
 
-        if not json_output:
-            all_repos = multi_fleet.discover_all_repositories()
-            total = sum(len(repos) for _, repos in all_repos)
+        all_repos = multi_fleet.discover_all_repositories()
+        total = sum(len(repos) for _, repos in all_repos)
+        if total and not json_output:
             with _create_progress_bar(console) as progress:
                 task = progress.add_task("Scanning...", total=total)
                 all_remotes = multi_fleet.get_all_remotes(
@@ -2859,10 +3645,10 @@ def remote(
     else:
         # Single root mode
         target_path = path if path else Path(".")
-        fleet = FleetManager(target_path)
+        fleet = FleetManager(target_path, max_workers=jobs)
 
-        if not json_output:
-            repos = fleet.discover_repositories()
+        repos = fleet.discover_repositories()
+        if repos and not json_output:
             with _create_progress_bar(console) as progress:
                 task = progress.add_task("Scanning...", total=len(repos))
                 remotes = fleet.get_all_remotes(
@@ -2872,4 +3658,4 @@ def remote(
         else:
             remotes = fleet.get_all_remotes(sequential=sequential)
 
-        formatter.print_remote_list(remotes, target_path.resolve())
+        formatter.print_remote_list(remotes, fleet.root_path)
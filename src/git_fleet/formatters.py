@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import json
-from collections import defaultdict
-from datetime import datetime
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
-from rich.table import Table
+from rich.text import Text
 
 if TYPE_CHECKING:
     from .core import (
@@ -17,6 +19,7 @@ if TYPE_CHECKING:
         GitRepository,
         GlobalIdentity,
         OperationResult,
+        RemoteInfo,
         RepositoryDiff,
         RepositoryIdentity,
         RepositoryRemotes,
@@ -25,6 +28,48 @@ if TYPE_CHECKING:
     )
 
 
+def write_json(console: Console, data: Any, *, default: Callable[[Any], Any] | None = None) -> None:
+    """Write data as indented JSON straight to the console's file.
+
+    console.print would soft-wrap long lines (breaking JSON strings) and
+    strip anything that looks like markup; encoding chunks are streamed
+    instead of building the whole document as one string first.
+    """
+    file = console.file
+    for chunk in json.JSONEncoder(indent=2, default=default).iterencode(data):
+        file.write(chunk)
+    file.write("\n")
+
+
+# Sync cells that do not depend on the ahead/behind counts. Keyed by SyncStatus
+# value: it is a StrEnum, so the common states resolve without importing core.
+_SYNC_ICONS_STATIC = {
+    "clean": "[green]✓[/]",
+    "no_upstream": "[dim]no upstream[/]",
+    "detached": "[dim]detached[/]",
+    "no_remote": "[dim]no remote[/]",
+}
+
+# Identity table cell color per config source; anything else ("unknown") is red
+_IDENTITY_SOURCE_COLORS = {
+    "local": "magenta",
+    "included": "yellow",
+    "system": "blue",
+    "global": "dim",
+}
+
+# Remote protocol colors ("none" marks repositories without remotes)
+_PROTOCOL_COLORS = {
+    "ssh": "green",
+    "https": "blue",
+    "http": "yellow",
+    "git": "cyan",
+    "file": "magenta",
+    "none": "dim",
+    "unknown": "red",
+}
+
+
 def compute_unique_root_names(roots: list[Path]) -> dict[Path, str]:
     """Compute unique display names for root paths.
 
@@ -37,7 +82,7 @@ def compute_unique_root_names(roots: list[Path]) -> dict[Path, str]:
     Returns:
         Dictionary mapping root path to display name
     """
-    if len(roots) <= 1:
+    if len({root.name for root in roots}) == len(roots):
         return {root: root.name for root in roots}
 
     # Group by name
@@ -78,6 +123,11 @@ def compute_unique_display_names(
     Returns:
         Dictionary mapping path to display name
     """
+    names = [getattr(item, name_attr) for item in items]
+    if len(set(names)) == len(names):
+        # No duplicates (the usual case): every item keeps its plain name
+        return {getattr(item, path_attr): name for item, name in zip(items, names)}
+
     # Group by name
     name_groups: dict[str, list[Any]] = defaultdict(list)
     for item in items:
@@ -101,6 +151,18 @@ def compute_unique_display_names(
     return result
 
 
+def _count_protocols(remotes: Iterable[RepositoryRemotes]) -> Counter[str]:
+    """Count remotes by protocol, with one "none" per repository that has no remotes.
+
+    Keys keep first-seen order, as the JSON summary relies on.
+    """
+    return Counter(
+        chain.from_iterable(
+            [remote.protocol for remote in r.remotes] if r.remotes else ["none"] for r in remotes
+        )
+    )
+
+
 def is_dirty_status(status: RepositoryStatus) -> bool:
     """Return True if a repository is in any non-pristine state.
 
@@ -129,32 +191,32 @@ def _make_paths_unique(paths: list[Path]) -> list[str]:
     Returns:
         List of unique display names in the same order as input paths
     """
-    # Split each path into parts (reversed for easier processing)
-    path_parts_list = [list(reversed(p.parts)) for p in paths]
-
-    result = []
-    for i, parts in enumerate(path_parts_list):
-        depth = 1
-        while depth <= len(parts):
-            candidate = "/".join(reversed(parts[:depth]))
-
-            # Check if unique among all other paths
-            is_unique = True
-            for j, other_parts in enumerate(path_parts_list):
-                if i != j:
-                    other_depth = min(depth, len(other_parts))
-                    other_candidate = "/".join(reversed(other_parts[:other_depth]))
-                    if candidate == other_candidate:
-                        is_unique = False
-                        break
-
-            if is_unique:
-                result.append(candidate)
-                break
-            depth += 1
-        else:
-            # Couldn't make unique (shouldn't happen with real paths)
-            result.append("/".join(reversed(parts)))
+    # Reversed parts, so a name with d components is the key parts[:d]
+    path_parts_list = [tuple(reversed(p.parts)) for p in paths]
+
+    # Group still-ambiguous paths by their last `depth` components. Paths that
+    # differ at some depth differ at every greater depth, so only the members
+    # of a shared group need to be compared again one level up.
+    result = [""] * len(paths)
+    pending = list(range(len(paths)))
+    depth = 1
+    while pending:
+        groups: dict[tuple[str, ...], list[int]] = defaultdict(list)
+        for i in pending:
+            groups[path_parts_list[i][:depth]].append(i)
+
+        pending = []
+        for key, members in groups.items():
+            if len(members) == 1:
+                result[members[0]] = "/".join(reversed(key))
+                continue
+            for i in members:
+                if depth < len(path_parts_list[i]):
+                    pending.append(i)
+                else:
+                    # Couldn't make unique (shouldn't happen with real paths)
+                    result[i] = "/".join(reversed(path_parts_list[i]))
+        depth += 1
 
     return result
 
@@ -166,6 +228,10 @@ class OutputFormatter:
         self.console = console
         self.use_json = use_json
 
+    def _print_lines(self, lines: list[str]):
+        """Print markup lines in one console.print call (markup is parsed per line)."""
+        self.console.print(*lines, sep="\n")
+
     def print_status_list(
         self,
         statuses: list[RepositoryStatus],
@@ -173,6 +239,7 @@ class OutputFormatter:
         root_path: Path,
         sync_summary: SyncOperationSummary | None = None,
         dirty_only: bool = False,
+        fsmonitor_errors: list[OperationResult] | None = None,
     ):
         """Print status list.
 
@@ -180,9 +247,11 @@ class OutputFormatter:
             dirty_only: When True, hide repositories that are clean AND in sync
                 from the rendered table. Ignored when use_json is True so machine
                 consumers always receive complete data.
+            fsmonitor_errors: Failed --enable-fsmonitor results, added to the
+                JSON output when given (the table run reports them upfront).
         """
         if self.use_json:
-            self._print_status_json(statuses, summary)
+            self._print_status_json(statuses, summary, fsmonitor_errors)
         else:
             self._print_status_table(statuses, summary, root_path, sync_summary, dirty_only)
 
@@ -209,6 +278,9 @@ class OutputFormatter:
         visible_statuses = [s for s in statuses if is_dirty_status(s)] if dirty_only else statuses
         hidden_count = len(statuses) - len(visible_statuses)
 
+        # rich.table is imported where a table is built: --json runs never need it
+        from rich.table import Table
+
         table = Table(title=f"Fleet Status: {root_path}")
 
         table.add_column("Repository", style="cyan", no_wrap=True)
@@ -217,6 +289,7 @@ class OutputFormatter:
         table.add_column("Working Tree", justify="center")
         table.add_column("Last Commit", justify="right")
 
+        now = datetime.now(UTC)
         for status in visible_statuses:
             repo_display = display_names.get(status.path, status.name)
 
@@ -227,7 +300,7 @@ class OutputFormatter:
             wt_status = self._get_working_tree_display(status)
 
             # Last commit date
-            last_commit = self._format_date(status.last_commit_date)
+            last_commit = self._format_date(status.last_commit_date, now)
 
             # Add warning for conflict risk
             if status.has_conflict_risk:
@@ -252,23 +325,19 @@ class OutputFormatter:
 
     def _get_sync_icon(self, status: RepositoryStatus) -> str:
         """Get sync status icon."""
+        static = _SYNC_ICONS_STATIC.get(status.sync_status)
+        if static is not None:
+            return static
+
         from .core import SyncStatus
 
         match status.sync_status:
-            case SyncStatus.CLEAN:
-                return "[green]✓[/]"
             case SyncStatus.AHEAD:
                 return f"[yellow]⬆ {status.ahead_count}[/]"
             case SyncStatus.BEHIND:
                 return f"[blue]⬇ {status.behind_count}[/]"
             case SyncStatus.DIVERGED:
                 return f"[red]⬆{status.ahead_count} ⬇{status.behind_count}[/]"
-            case SyncStatus.NO_UPSTREAM:
-                return "[dim]no upstream[/]"
-            case SyncStatus.DETACHED:
-                return "[dim]detached[/]"
-            case SyncStatus.NO_REMOTE:
-                return "[dim]no remote[/]"
             case SyncStatus.ERROR:
                 return f"[red]✗ {status.error_message[:20]}[/]"
             case _:
@@ -291,12 +360,17 @@ class OutputFormatter:
 
         return " ".join(parts)
 
-    def _format_date(self, dt: datetime | None) -> str:
-        """Format datetime for display."""
+    def _format_date(self, dt: datetime | None, now: datetime | None = None) -> str:
+        """Format datetime for display.
+
+        Table printers pass one aware ``now`` for every row; the difference of
+        aware datetimes does not depend on either one's timezone.
+        """
         if dt is None:
             return "[dim]unknown[/]"
 
-        now = datetime.now(dt.tzinfo)
+        if now is None:
+            now = datetime.now(dt.tzinfo)
         delta = now - dt
 
         if delta.days == 0:
@@ -373,13 +447,20 @@ class OutputFormatter:
             if sync_parts:
                 self.console.print("[bold]Synced:[/] " + " | ".join(sync_parts))
 
-    def _print_status_json(self, statuses: list[RepositoryStatus], summary: FleetSummary):
+    def _print_status_json(
+        self,
+        statuses: list[RepositoryStatus],
+        summary: FleetSummary,
+        fsmonitor_errors: list[OperationResult] | None = None,
+    ):
         """Print JSON output."""
-        output = {
+        output: dict[str, Any] = {
             "repositories": [s.to_dict() for s in statuses],
             "summary": summary.to_dict(),
         }
-        self.console.print(json.dumps(output, indent=2, default=str))
+        if fsmonitor_errors is not None:
+            output["enable_fsmonitor_errors"] = [r.to_dict() for r in fsmonitor_errors]
+        write_json(self.console, output, default=str)
 
     def print_operation_results(self, results: list[OperationResult], operation: str):
         """Print operation results."""
@@ -397,6 +478,8 @@ class OutputFormatter:
         # Compute unique display names for duplicate repo names
         display_names = compute_unique_display_names(results)
 
+        from rich.table import Table
+
         table = Table(title=f"{operation.title()} Results")
         table.add_column("Repository", style="cyan")
         table.add_column("Status", justify="center")
@@ -441,7 +524,7 @@ class OutputFormatter:
             "results": [r.to_dict() for r in results],
             "summary": summary,
         }
-        self.console.print(json.dumps(output, indent=2))
+        write_json(self.console, output)
 
     def print_repo_list(self, repos: list[GitRepository], root_path: Path):
         """Print simple repository list."""
@@ -460,14 +543,15 @@ class OutputFormatter:
                     for r in repos
                 ],
             }
-            self.console.print(json.dumps(output, indent=2))
+            write_json(self.console, output)
         else:
             # Compute unique display names for duplicate repo names
             display_names = compute_unique_display_names(repos)
-            self.console.print(f"[bold]Found {len(repos)} repositories in {root_path}[/]\n")
+            lines = [f"[bold]Found {len(repos)} repositories in {root_path}[/]", ""]
             for repo in repos:
                 repo_display = display_names.get(repo.path, repo.name)
-                self.console.print(f"  [cyan]{repo_display}[/]")
+                lines.append(f"  [cyan]{repo_display}[/]")
+            self._print_lines(lines)
 
     def print_identity_list(
         self,
@@ -492,12 +576,18 @@ class OutputFormatter:
         display_names = compute_unique_display_names(identities)
 
         # Print global identity first
-        self.console.print("[bold]Global Identity:[/]")
-        self.console.print(f"  [dim]user.name:[/]  {global_identity.user_name}")
-        self.console.print(f"  [dim]user.email:[/] {global_identity.user_email}")
-        self.console.print()
+        self._print_lines(
+            [
+                "[bold]Global Identity:[/]",
+                f"  [dim]user.name:[/]  {global_identity.user_name}",
+                f"  [dim]user.email:[/] {global_identity.user_email}",
+                "",
+            ]
+        )
 
         # Create table
+        from rich.table import Table
+
         table = Table(title=f"Repository Identities: {root_path}")
 
         table.add_column("Repository", style="cyan", no_wrap=True)
@@ -514,21 +604,12 @@ class OutputFormatter:
             # Count by source type
             source_counts[source_type] = source_counts.get(source_type, 0) + 1
 
-            # Color based on source type
-            if source_type == "local":
-                color = "magenta"
-            elif source_type == "included":
-                color = "yellow"
-            elif source_type == "system":
-                color = "blue"
-            elif source_type == "global":
-                color = "dim"
-            else:  # unknown
-                color = "red"
-
-            name_display = f"[{color}]{identity.user_name}[/]"
-            email_display = f"[{color}]{identity.user_email}[/]"
-            source_display = f"[{color}]{source_type}[/]"
+            color = _IDENTITY_SOURCE_COLORS.get(source_type, "red")
+
+            # Styled Text cells: config values are shown verbatim, never parsed as markup
+            name_display = Text.assemble((identity.user_name, color))
+            email_display = Text.assemble((identity.user_email, color))
+            source_display = Text.assemble((source_type, color))
 
             table.add_row(repo_display, name_display, email_display, source_display)
 
@@ -557,10 +638,12 @@ class OutputFormatter:
         root_path: Path,
     ):
         """Print identity list as JSON."""
-        # Count by source type
+        # Count by source type and local overrides in one pass
         source_counts: dict[str, int] = {}
+        local_override = 0
         for i in identities:
             source_counts[i.source] = source_counts.get(i.source, 0) + 1
+            local_override += i.is_local_override
 
         output = {
             "root": str(root_path),
@@ -570,11 +653,11 @@ class OutputFormatter:
                 "total": len(identities),
                 "by_source": source_counts,
                 # Backward compatibility
-                "using_global": sum(1 for i in identities if not i.is_local_override),
-                "local_override": sum(1 for i in identities if i.is_local_override),
+                "using_global": len(identities) - local_override,
+                "local_override": local_override,
             },
         }
-        self.console.print(json.dumps(output, indent=2))
+        write_json(self.console, output)
 
     def print_multi_root_identity_list(
         self,
@@ -594,7 +677,7 @@ class OutputFormatter:
     ):
         """Print multi-root identity table output."""
         # Flatten all identities and compute unique display names
-        all_items = [identity for _, identities in all_identities for identity in identities]
+        all_items = list(chain.from_iterable(identities for _, identities in all_identities))
         display_names = compute_unique_display_names(all_items)
 
         # Compute unique root names
@@ -602,13 +685,19 @@ class OutputFormatter:
         root_names = compute_unique_root_names(roots)
 
         # Print global identity first
-        self.console.print("[bold]Global Identity:[/]")
-        self.console.print(f"  [dim]user.name:[/]  {global_identity.user_name}")
-        self.console.print(f"  [dim]user.email:[/] {global_identity.user_email}")
-        self.console.print()
+        self._print_lines(
+            [
+                "[bold]Global Identity:[/]",
+                f"  [dim]user.name:[/]  {global_identity.user_name}",
+                f"  [dim]user.email:[/] {global_identity.user_email}",
+                "",
+            ]
+        )
 
         # Create table
         root_count = len(all_identities)
+        from rich.table import Table
+
         table = Table(title=f"Repository Identities ({root_count} roots)")
 
         table.add_column("Root", style="yellow", no_wrap=True)
@@ -630,21 +719,12 @@ class OutputFormatter:
                 # Count by source type
                 source_counts[source_type] = source_counts.get(source_type, 0) + 1
 
-                # Color based on source type
-                if source_type == "local":
-                    color = "magenta"
-                elif source_type == "included":
-                    color = "yellow"
-                elif source_type == "system":
-                    color = "blue"
-                elif source_type == "global":
-                    color = "dim"
-                else:  # unknown
-                    color = "red"
-
-                name_display = f"[{color}]{identity.user_name}[/]"
-                email_display = f"[{color}]{identity.user_email}[/]"
-                source_display = f"[{color}]{source_type}[/]"
+                color = _IDENTITY_SOURCE_COLORS.get(source_type, "red")
+
+                # Styled Text cells: config values are shown verbatim, never parsed as markup
+                name_display = Text.assemble((identity.user_name, color))
+                email_display = Text.assemble((identity.user_email, color))
+                source_display = Text.assemble((source_type, color))
 
                 table.add_row(root_name, repo_display, name_display, email_display, source_display)
 
@@ -677,17 +757,15 @@ class OutputFormatter:
         root_names = compute_unique_root_names(roots)
 
         total = 0
-        using_global = 0
         local_override = 0
         source_counts: dict[str, int] = {}
 
         roots_data = []
         for root, identities in all_identities:
             total += len(identities)
-            using_global += sum(1 for i in identities if not i.is_local_override)
-            local_override += sum(1 for i in identities if i.is_local_override)
             for i in identities:
                 source_counts[i.source] = source_counts.get(i.source, 0) + 1
+                local_override += i.is_local_override
             roots_data.append(
                 {
                     "root": str(root),
@@ -703,11 +781,11 @@ class OutputFormatter:
                 "total": total,
                 "by_source": source_counts,
                 # Backward compatibility
-                "using_global": using_global,
+                "using_global": total - local_override,
                 "local_override": local_override,
             },
         }
-        self.console.print(json.dumps(output, indent=2))
+        write_json(self.console, output)
 
     def print_multi_root_status_list(
         self,
@@ -715,6 +793,7 @@ class OutputFormatter:
         summary: FleetSummary,
         sync_summary: SyncOperationSummary | None = None,
         dirty_only: bool = False,
+        fsmonitor_errors: list[OperationResult] | None = None,
     ):
         """Print status list for multiple roots.
 
@@ -722,9 +801,11 @@ class OutputFormatter:
             dirty_only: When True, hide repositories that are clean AND in sync
                 from the rendered table. Ignored when use_json is True so machine
                 consumers always receive complete data.
+            fsmonitor_errors: Failed --enable-fsmonitor results, added to the
+                JSON output when given (the table run reports them upfront).
         """
         if self.use_json:
-            self._print_multi_root_status_json(all_statuses, summary)
+            self._print_multi_root_status_json(all_statuses, summary, fsmonitor_errors)
         else:
             self._print_multi_root_status_table(all_statuses, summary, sync_summary, dirty_only)
 
@@ -738,7 +819,7 @@ class OutputFormatter:
         """Print multi-root status table output."""
         # Flatten all statuses and compute unique display names
         # (use the full status list so names stay stable when filtering)
-        all_items = [status for _, statuses in all_statuses for status in statuses]
+        all_items = list(chain.from_iterable(statuses for _, statuses in all_statuses))
         display_names = compute_unique_display_names(all_items)
 
         # Compute unique root names
@@ -752,6 +833,8 @@ class OutputFormatter:
         hidden_count = total_count - visible_count
 
         root_count = len(all_statuses)
+        from rich.table import Table
+
         table = Table(title=f"Fleet Status ({root_count} roots)")
 
         table.add_column("Root", style="yellow", no_wrap=True)
@@ -761,6 +844,7 @@ class OutputFormatter:
         table.add_column("Working Tree", justify="center")
         table.add_column("Last Commit", justify="right")
 
+        now = datetime.now(UTC)
         for root, statuses in all_statuses:
             root_name = root_names.get(root, root.name)
             for status in statuses:
@@ -769,7 +853,7 @@ class OutputFormatter:
 
                 sync_icon = self._get_sync_icon(status)
                 wt_status = self._get_working_tree_display(status)
-                last_commit = self._format_date(status.last_commit_date)
+                last_commit = self._format_date(status.last_commit_date, now)
 
                 repo_display = display_names.get(status.path, status.name)
                 if status.has_conflict_risk:
@@ -792,6 +876,7 @@ class OutputFormatter:
         self,
         all_statuses: list[tuple[Path, list[RepositoryStatus]]],
         summary: FleetSummary,
+        fsmonitor_errors: list[OperationResult] | None = None,
     ):
         """Print multi-root status as JSON."""
         # Compute unique root names
@@ -808,11 +893,13 @@ class OutputFormatter:
                 }
             )
 
-        output = {
+        output: dict[str, Any] = {
             "roots": roots_data,
             "summary": summary.to_dict(),
         }
-        self.console.print(json.dumps(output, indent=2, default=str))
+        if fsmonitor_errors is not None:
+            output["enable_fsmonitor_errors"] = [r.to_dict() for r in fsmonitor_errors]
+        write_json(self.console, output, default=str)
 
     def print_multi_root_repo_list(
         self,
@@ -820,7 +907,7 @@ class OutputFormatter:
     ):
         """Print repository list for multiple roots."""
         # Flatten all repos and compute unique display names
-        all_items = [repo for _, repos in all_repos for repo in repos]
+        all_items = list(chain.from_iterable(repos for _, repos in all_repos))
         display_names = compute_unique_display_names(all_items)
 
         # Compute unique root names
@@ -850,16 +937,17 @@ class OutputFormatter:
                 "roots": roots_data,
                 "total": total,
             }
-            self.console.print(json.dumps(output, indent=2))
+            write_json(self.console, output)
         else:
             total = sum(len(repos) for _, repos in all_repos)
-            self.console.print(f"[bold]Found {total} repositories in {len(all_repos)} roots[/]\n")
+            lines = [f"[bold]Found {total} repositories in {len(all_repos)} roots[/]", ""]
             for root, repos in all_repos:
-                self.console.print(f"[yellow]{root_names.get(root, root.name)}[/]:")
+                lines.append(f"[yellow]{root_names.get(root, root.name)}[/]:")
                 for repo in repos:
                     repo_display = display_names.get(repo.path, repo.name)
-                    self.console.print(f"  [cyan]{repo_display}[/]")
-                self.console.print()
+                    lines.append(f"  [cyan]{repo_display}[/]")
+                lines.append("")
+            self._print_lines(lines)
 
     def print_multi_root_operation_results(
         self,
@@ -868,16 +956,18 @@ class OutputFormatter:
     ):
         """Print operation results for multiple roots."""
         # Flatten all results and compute unique display names
-        all_items = [result for _, results in all_results for result in results]
+        all_items = list(chain.from_iterable(results for _, results in all_results))
         display_names = compute_unique_display_names(all_items)
 
         # Compute unique root names
         roots = [root for root, _ in all_results]
         root_names = compute_unique_root_names(roots)
 
+        total = len(all_items)
+        success_count = sum(1 for r in all_items if r.success)
+        warned_count = sum(1 for r in all_items if r.success and r.warning)
+
         if self.use_json:
-            total = sum(len(results) for _, results in all_results)
-            success = sum(sum(1 for r in results if r.success) for _, results in all_results)
             roots_data = []
             for root, results in all_results:
                 roots_data.append(
@@ -889,38 +979,28 @@ class OutputFormatter:
                 )
             summary: dict[str, int] = {
                 "total": total,
-                "success": success,
-                "failed": total - success,
+                "success": success_count,
+                "failed": total - success_count,
             }
-            warned = sum(
-                sum(1 for r in results if r.success and r.warning) for _, results in all_results
-            )
-            if warned:
-                summary["warned"] = warned
+            if warned_count:
+                summary["warned"] = warned_count
             output = {
                 "roots": roots_data,
                 "summary": summary,
             }
-            self.console.print(json.dumps(output, indent=2))
+            write_json(self.console, output)
         else:
-            total = 0
-            success_count = 0
-            warned_count = 0
-
-            flat_results = []
-            for root, results in all_results:
-                for result in results:
-                    flat_results.append((root_names.get(root, root.name), result))
-                    total += 1
-                    if result.success:
-                        success_count += 1
-                        if result.warning:
-                            warned_count += 1
-
+            flat_results = [
+                (root_names.get(root, root.name), result)
+                for root, results in all_results
+                for result in results
+            ]
             if not flat_results:
                 self.console.print(f"[dim]No repositories to {operation}[/]")
                 return
 
+            from rich.table import Table
+
             table = Table(title=f"{operation.title()} Results")
             table.add_column("Root", style="yellow")
             table.add_column("Repository", style="cyan")
@@ -968,6 +1048,8 @@ class OutputFormatter:
         # Compute unique display names for duplicate repo names
         display_names = compute_unique_display_names(remotes)
 
+        from rich.table import Table
+
         table = Table(title=f"Repository Remotes: {root_path}")
 
         table.add_column("Repository", style="cyan", no_wrap=True)
@@ -975,7 +1057,7 @@ class OutputFormatter:
         table.add_column("URL")
         table.add_column("Protocol", justify="center")
 
-        protocol_counts: dict[str, int] = {}
+        protocol_counts = _count_protocols(remotes)
         total_repos = len(remotes)
         total_remotes = 0
 
@@ -983,21 +1065,16 @@ class OutputFormatter:
             repo_display_name = display_names.get(repo_remotes.path, repo_remotes.name)
 
             if not repo_remotes.remotes:
-                table.add_row(repo_display_name, "[dim]none[/]", "[dim]-[/]", "[dim]-[/]")
-                protocol_counts["none"] = protocol_counts.get("none", 0) + 1
+                table.add_row(repo_display_name, *self._no_remote_cells())
             else:
                 for i, remote in enumerate(repo_remotes.remotes):
                     total_remotes += 1
-                    protocol_counts[remote.protocol] = protocol_counts.get(remote.protocol, 0) + 1
 
                     # Color based on protocol
-                    protocol_color = self._get_protocol_color(remote.protocol)
-                    protocol_display = f"[{protocol_color}]{remote.protocol}[/]"
+                    protocol_display = self._protocol_text(remote.protocol)
 
                     # Show push URL if different from fetch URL
-                    url_display = remote.fetch_url
-                    if remote.push_url != remote.fetch_url:
-                        url_display = f"{remote.fetch_url}\n[dim]push: {remote.push_url}[/]"
+                    url_display = self._url_text(remote)
 
                     # Only show repo name on first row
                     repo_display = repo_display_name if i == 0 else ""
@@ -1007,24 +1084,48 @@ class OutputFormatter:
         self.console.print()
 
         # Build summary line
-        summary_parts = [f"[bold]Repos:[/] {total_repos}", f"[bold]Remotes:[/] {total_remotes}"]
-        for proto, count in sorted(protocol_counts.items()):
-            color = self._get_protocol_color(proto)
-            summary_parts.append(f"[{color}]{proto.upper()}:[/] {count}")
-        self.console.print(" | ".join(summary_parts))
+        self.console.print(self._remote_summary_line(total_repos, total_remotes, protocol_counts))
+
+    # Remote cells are built as Text spans: URLs and names are shown verbatim
+    # and Rich does not have to parse markup for every row.
+    def _protocol_text(self, protocol: str) -> Text:
+        """Get the protocol cell, colored by protocol."""
+        return Text.assemble((protocol, self._get_protocol_color(protocol)))
+
+    @staticmethod
+    def _url_text(remote: RemoteInfo) -> Text:
+        """Get the URL cell, adding a dim push URL line when it differs."""
+        if remote.push_url == remote.fetch_url:
+            return Text(remote.fetch_url)
+        return Text.assemble(remote.fetch_url, "\n", (f"push: {remote.push_url}", "dim"))
+
+    @staticmethod
+    def _no_remote_cells() -> tuple[Text, Text, Text]:
+        """Get the Remote/URL/Protocol cells for a repository without remotes."""
+        return (
+            Text.assemble(("none", "dim")),
+            Text.assemble(("-", "dim")),
+            Text.assemble(("-", "dim")),
+        )
 
     def _get_protocol_color(self, protocol: str) -> str:
         """Get color for protocol display."""
-        colors = {
-            "ssh": "green",
-            "https": "blue",
-            "http": "yellow",
-            "git": "cyan",
-            "file": "magenta",
-            "none": "dim",
-            "unknown": "red",
-        }
-        return colors.get(protocol, "white")
+        return _PROTOCOL_COLORS.get(protocol, "white")
+
+    def _remote_summary_line(
+        self, total_repos: int, total_remotes: int, protocol_counts: Counter[str]
+    ) -> str:
+        """Build the Repos/Remotes/per-protocol summary markup line."""
+        return " | ".join(
+            [
+                f"[bold]Repos:[/] {total_repos}",
+                f"[bold]Remotes:[/] {total_remotes}",
+                *(
+                    f"[{_PROTOCOL_COLORS.get(proto, 'white')}]{proto.upper()}:[/] {count}"
+                    for proto, count in sorted(protocol_counts.items())
+                ),
+            ]
+        )
 
     def _print_remote_json(
         self,
@@ -1032,12 +1133,7 @@ class OutputFormatter:
         root_path: Path,
     ):
         """Print remote list as JSON."""
-        protocol_counts: dict[str, int] = {}
-        for repo_remotes in remotes:
-            for remote in repo_remotes.remotes:
-                protocol_counts[remote.protocol] = protocol_counts.get(remote.protocol, 0) + 1
-            if not repo_remotes.remotes:
-                protocol_counts["none"] = protocol_counts.get("none", 0) + 1
+        protocol_counts = _count_protocols(remotes)
 
         output = {
             "root": str(root_path),
@@ -1048,7 +1144,7 @@ class OutputFormatter:
                 "by_protocol": protocol_counts,
             },
         }
-        self.console.print(json.dumps(output, indent=2))
+        write_json(self.console, output)
 
     def print_multi_root_remote_list(
         self,
@@ -1066,9 +1162,7 @@ class OutputFormatter:
     ):
         """Print multi-root remote table output."""
         # Flatten all remotes and compute unique display names
-        all_items = [
-            repo_remotes for _, remotes_list in all_remotes for repo_remotes in remotes_list
-        ]
+        all_items = list(chain.from_iterable(remotes_list for _, remotes_list in all_remotes))
         display_names = compute_unique_display_names(all_items)
 
         # Compute unique root names
@@ -1076,6 +1170,8 @@ class OutputFormatter:
         root_names = compute_unique_root_names(roots)
 
         root_count = len(all_remotes)
+        from rich.table import Table
+
         table = Table(title=f"Repository Remotes ({root_count} roots)")
 
         table.add_column("Root", style="yellow", no_wrap=True)
@@ -1084,7 +1180,7 @@ class OutputFormatter:
         table.add_column("URL")
         table.add_column("Protocol", justify="center")
 
-        protocol_counts: dict[str, int] = {}
+        protocol_counts = _count_protocols(all_items)
         total_repos = 0
         total_remotes = 0
 
@@ -1095,23 +1191,14 @@ class OutputFormatter:
                 repo_display_name = display_names.get(repo_remotes.path, repo_remotes.name)
 
                 if not repo_remotes.remotes:
-                    table.add_row(
-                        root_name, repo_display_name, "[dim]none[/]", "[dim]-[/]", "[dim]-[/]"
-                    )
-                    protocol_counts["none"] = protocol_counts.get("none", 0) + 1
+                    table.add_row(root_name, repo_display_name, *self._no_remote_cells())
                 else:
                     for i, remote in enumerate(repo_remotes.remotes):
                         total_remotes += 1
-                        protocol_counts[remote.protocol] = (
-                            protocol_counts.get(remote.protocol, 0) + 1
-                        )
 
-                        protocol_color = self._get_protocol_color(remote.protocol)
-                        protocol_display = f"[{protocol_color}]{remote.protocol}[/]"
+                        protocol_display = self._protocol_text(remote.protocol)
 
-                        url_display = remote.fetch_url
-                        if remote.push_url != remote.fetch_url:
-                            url_display = f"{remote.fetch_url}\n[dim]push: {remote.push_url}[/]"
+                        url_display = self._url_text(remote)
 
                         # Only show root and repo name on first row
                         root_display = root_name if i == 0 else ""
@@ -1124,11 +1211,7 @@ class OutputFormatter:
         self.console.print()
 
         # Build summary line
-        summary_parts = [f"[bold]Repos:[/] {total_repos}", f"[bold]Remotes:[/] {total_remotes}"]
-        for proto, count in sorted(protocol_counts.items()):
-            color = self._get_protocol_color(proto)
-            summary_parts.append(f"[{color}]{proto.upper()}:[/] {count}")
-        self.console.print(" | ".join(summary_parts))
+        self.console.print(self._remote_summary_line(total_repos, total_remotes, protocol_counts))
 
     def _print_multi_root_remote_json(
         self,
@@ -1141,17 +1224,13 @@ class OutputFormatter:
 
         total_repos = 0
         total_remotes = 0
-        protocol_counts: dict[str, int] = {}
+        protocol_counts = _count_protocols(chain.from_iterable(rr for _, rr in all_remotes))
 
         roots_data = []
         for root, repo_remotes_list in all_remotes:
             total_repos += len(repo_remotes_list)
             for repo_remotes in repo_remotes_list:
                 total_remotes += len(repo_remotes.remotes)
-                for remote in repo_remotes.remotes:
-                    protocol_counts[remote.protocol] = protocol_counts.get(remote.protocol, 0) + 1
-                if not repo_remotes.remotes:
-                    protocol_counts["none"] = protocol_counts.get("none", 0) + 1
 
             roots_data.append(
                 {
@@ -1169,7 +1248,7 @@ class OutputFormatter:
                 "by_protocol": protocol_counts,
             },
         }
-        self.console.print(json.dumps(output, indent=2))
+        write_json(self.console, output)
 
     def print_repo_list_with_remotes(
         self,
@@ -1193,7 +1272,9 @@ class OutputFormatter:
         # Compute unique display names for duplicate repo names
         display_names = compute_unique_display_names(repos)
         # Build lookup by path
-        remotes_by_path = {str(r.path): r for r in remotes}
+        remotes_by_path = {r.path: r for r in remotes}
+
+        from rich.table import Table
 
         table = Table(title=f"Repositories with Remotes: {root_path}")
         table.add_column("Repository", style="cyan", no_wrap=True)
@@ -1203,16 +1284,17 @@ class OutputFormatter:
 
         for repo in repos:
             repo_display_name = display_names.get(repo.path, repo.name)
-            repo_remotes = remotes_by_path.get(str(repo.path))
+            repo_remotes = remotes_by_path.get(repo.path)
 
             if repo_remotes and repo_remotes.remotes:
                 for i, remote in enumerate(repo_remotes.remotes):
-                    protocol_color = self._get_protocol_color(remote.protocol)
-                    protocol_display = f"[{protocol_color}]{remote.protocol}[/]"
+                    protocol_display = self._protocol_text(remote.protocol)
                     repo_display = repo_display_name if i == 0 else ""
-                    table.add_row(repo_display, remote.name, remote.fetch_url, protocol_display)
+                    table.add_row(
+                        repo_display, remote.name, Text(remote.fetch_url), protocol_display
+                    )
             else:
-                table.add_row(repo_display_name, "[dim]none[/]", "[dim]-[/]", "[dim]-[/]")
+                table.add_row(repo_display_name, *self._no_remote_cells())
 
         self.console.print(table)
 
@@ -1223,36 +1305,25 @@ class OutputFormatter:
         root_path: Path,
     ):
         """Print repository list with remote info as JSON."""
-        remotes_by_path = {str(r.path): r for r in remotes}
+        remotes_by_path = {r.path: r for r in remotes}
 
         repo_data = []
         for repo in repos:
-            repo_remotes = remotes_by_path.get(str(repo.path))
+            repo_remotes = remotes_by_path.get(repo.path)
             repo_data.append(
                 {
                     "path": str(repo.path),
                     "name": repo.name,
-                    "remotes": repo_remotes.remotes if repo_remotes else [],
+                    "remotes": [r.to_dict() for r in repo_remotes.remotes] if repo_remotes else [],
                 }
             )
 
         output = {
             "root": str(root_path),
             "count": len(repos),
-            "repositories": [
-                {
-                    "path": str(r.path),
-                    "name": r.name,
-                    "remotes": (
-                        remotes_by_path[str(r.path)].to_dict()["remotes"]
-                        if str(r.path) in remotes_by_path
-                        else []
-                    ),
-                }
-                for r in repos
-            ],
+            "repositories": repo_data,
         }
-        self.console.print(json.dumps(output, indent=2))
+        write_json(self.console, output)
 
     def print_multi_root_repo_list_with_remotes(
         self,
@@ -1272,7 +1343,7 @@ class OutputFormatter:
     ):
         """Print multi-root repository list with remote info as table."""
         # Flatten all repos and compute unique display names
-        all_items = [repo for _, repos in all_repos for repo in repos]
+        all_items = list(chain.from_iterable(repos for _, repos in all_repos))
         display_names = compute_unique_display_names(all_items)
 
         # Compute unique root names
@@ -1280,11 +1351,13 @@ class OutputFormatter:
         root_names = compute_unique_root_names(roots)
 
         # Build lookup by root and path
-        remotes_lookup: dict[str, dict[str, RepositoryRemotes]] = {}
-        for root, remotes_list in all_remotes:
-            remotes_lookup[str(root)] = {str(r.path): r for r in remotes_list}
+        remotes_lookup: dict[Path, dict[Path, RepositoryRemotes]] = {
+            root: {r.path: r for r in remotes_list} for root, remotes_list in all_remotes
+        }
 
         total = sum(len(repos) for _, repos in all_repos)
+        from rich.table import Table
+
         table = Table(title=f"Repositories with Remotes ({len(all_repos)} roots, {total} repos)")
 
         table.add_column("Root", style="yellow", no_wrap=True)
@@ -1295,29 +1368,26 @@ class OutputFormatter:
 
         for root, repos in all_repos:
             root_name = root_names.get(root, root.name)
-            root_remotes = remotes_lookup.get(str(root), {})
+            root_remotes = remotes_lookup.get(root, {})
 
             for repo in repos:
                 repo_display_name = display_names.get(repo.path, repo.name)
-                repo_remotes = root_remotes.get(str(repo.path))
+                repo_remotes = root_remotes.get(repo.path)
 
                 if repo_remotes and repo_remotes.remotes:
                     for i, remote in enumerate(repo_remotes.remotes):
-                        protocol_color = self._get_protocol_color(remote.protocol)
-                        protocol_display = f"[{protocol_color}]{remote.protocol}[/]"
+                        protocol_display = self._protocol_text(remote.protocol)
                         root_display = root_name if i == 0 else ""
                         repo_display = repo_display_name if i == 0 else ""
                         table.add_row(
                             root_display,
                             repo_display,
                             remote.name,
-                            remote.fetch_url,
+                            Text(remote.fetch_url),
                             protocol_display,
                         )
                 else:
-                    table.add_row(
-                        root_name, repo_display_name, "[dim]none[/]", "[dim]-[/]", "[dim]-[/]"
-                    )
+                    table.add_row(root_name, repo_display_name, *self._no_remote_cells())
 
         self.console.print(table)
 
@@ -1331,24 +1401,26 @@ class OutputFormatter:
         roots = [root for root, _ in all_repos]
         root_names = compute_unique_root_names(roots)
 
-        remotes_lookup: dict[str, dict[str, RepositoryRemotes]] = {}
-        for root, remotes_list in all_remotes:
-            remotes_lookup[str(root)] = {str(r.path): r for r in remotes_list}
+        remotes_lookup: dict[Path, dict[Path, RepositoryRemotes]] = {
+            root: {r.path: r for r in remotes_list} for root, remotes_list in all_remotes
+        }
 
         total = sum(len(repos) for _, repos in all_repos)
         roots_data = []
 
         for root, repos in all_repos:
-            root_remotes = remotes_lookup.get(str(root), {})
+            root_remotes = remotes_lookup.get(root, {})
             repos_data = []
 
             for repo in repos:
-                repo_remotes = root_remotes.get(str(repo.path))
+                repo_remotes = root_remotes.get(repo.path)
                 repos_data.append(
                     {
                         "path": str(repo.path),
                         "name": repo.name,
-                        "remotes": (repo_remotes.to_dict()["remotes"] if repo_remotes else []),
+                        "remotes": [r.to_dict() for r in repo_remotes.remotes]
+                        if repo_remotes
+                        else [],
                     }
                 )
 
@@ -1365,7 +1437,7 @@ class OutputFormatter:
             "roots": roots_data,
             "total": total,
         }
-        self.console.print(json.dumps(output, indent=2))
+        write_json(self.console, output)
 
     # -----------------------------------------------------------------
     # Diff output
@@ -1396,31 +1468,14 @@ class OutputFormatter:
 
         display_names = compute_unique_display_names(diffs)
 
-        self.console.print(
-            f"[bold]Dirty repositories: {len(diffs)}/{total_repos}[/] in {root_path}\n"
-        )
-
+        lines = [f"[bold]Dirty repositories: {len(diffs)}/{total_repos}[/] in {root_path}", ""]
         for diff in diffs:
             repo_display = display_names.get(diff.path, diff.name)
             branch_display = f" [blue]({diff.branch})[/]" if diff.branch else ""
-            self.console.print(f"[bold cyan]{repo_display}[/]{branch_display}")
-
-            if diff.staged_files:
-                self.console.print("  [green]Staged:[/]")
-                for status, filename in diff.staged_files:
-                    self.console.print(f"    [green]{status}[/]  {filename}")
-
-            if diff.unstaged_files:
-                self.console.print("  [yellow]Unstaged:[/]")
-                for status, filename in diff.unstaged_files:
-                    self.console.print(f"    [yellow]{status}[/]  {filename}")
-
-            if diff.untracked_files:
-                self.console.print("  [red]Untracked:[/]")
-                for filename in diff.untracked_files:
-                    self.console.print(f"    [red]?[/]  {filename}")
-
-            self.console.print()
+            lines.append(f"[bold cyan]{repo_display}[/]{branch_display}")
+            self._append_diff_files(lines, diff, "  ")
+            lines.append("")
+        self._print_lines(lines)
 
         self._print_diff_summary(diffs, total_repos)
 
@@ -1436,7 +1491,7 @@ class OutputFormatter:
             "repositories": [d.to_dict() for d in diffs],
             "summary": self._build_diff_summary_dict(diffs, total_repos),
         }
-        self.console.print(json.dumps(output, indent=2))
+        write_json(self.console, output)
 
     def print_multi_root_diff_list(
         self,
@@ -1455,7 +1510,7 @@ class OutputFormatter:
         total_repos_per_root: dict[Path, int],
     ):
         """Print multi-root file-level diff as Rich formatted output."""
-        all_items = [d for _, diffs in all_diffs for d in diffs]
+        all_items = list(chain.from_iterable(diffs for _, diffs in all_diffs))
         display_names = compute_unique_display_names(all_items)
 
         roots = [root for root, _ in all_diffs]
@@ -1468,37 +1523,24 @@ class OutputFormatter:
             self.console.print(f"[green]All {total_repos} repositories are clean[/]")
             return
 
-        self.console.print(
-            f"[bold]Dirty repositories: {total_dirty}/{total_repos} across {len(roots)} roots[/]\n"
-        )
-
+        lines = [
+            f"[bold]Dirty repositories: {total_dirty}/{total_repos} across {len(roots)} roots[/]",
+            "",
+        ]
         for root, diffs in all_diffs:
             if not diffs:
                 continue
             root_name = root_names.get(root, root.name)
-            self.console.print(f"[bold yellow]{root_name}[/]")
+            lines.append(f"[bold yellow]{root_name}[/]")
 
             for diff in diffs:
                 repo_display = display_names.get(diff.path, diff.name)
                 branch_display = f" [blue]({diff.branch})[/]" if diff.branch else ""
-                self.console.print(f"  [bold cyan]{repo_display}[/]{branch_display}")
+                lines.append(f"  [bold cyan]{repo_display}[/]{branch_display}")
+                self._append_diff_files(lines, diff, "    ")
 
-                if diff.staged_files:
-                    self.console.print("    [green]Staged:[/]")
-                    for status, filename in diff.staged_files:
-                        self.console.print(f"      [green]{status}[/]  {filename}")
-
-                if diff.unstaged_files:
-                    self.console.print("    [yellow]Unstaged:[/]")
-                    for status, filename in diff.unstaged_files:
-                        self.console.print(f"      [yellow]{status}[/]  {filename}")
-
-                if diff.untracked_files:
-                    self.console.print("    [red]Untracked:[/]")
-                    for filename in diff.untracked_files:
-                        self.console.print(f"      [red]?[/]  {filename}")
-
-            self.console.print()
+            lines.append("")
+        self._print_lines(lines)
 
         self._print_diff_summary(all_items, total_repos)
 
@@ -1512,7 +1554,7 @@ class OutputFormatter:
         root_names = compute_unique_root_names(roots)
 
         total_repos = sum(total_repos_per_root.values())
-        all_items = [d for _, diffs in all_diffs for d in diffs]
+        all_items = list(chain.from_iterable(diffs for _, diffs in all_diffs))
 
         roots_data = []
         for root, diffs in all_diffs:
@@ -1528,29 +1570,50 @@ class OutputFormatter:
             "roots": roots_data,
             "summary": self._build_diff_summary_dict(all_items, total_repos),
         }
-        self.console.print(json.dumps(output, indent=2))
+        write_json(self.console, output)
+
+    @staticmethod
+    def _append_diff_files(lines: list[str], diff: RepositoryDiff, indent: str):
+        """Append the staged/unstaged/untracked file sections of one repository."""
+        if diff.staged_files:
+            lines.append(f"{indent}[green]Staged:[/]")
+            for status, filename in diff.staged_files:
+                lines.append(f"{indent}  [green]{status}[/]  {filename}")
+
+        if diff.unstaged_files:
+            lines.append(f"{indent}[yellow]Unstaged:[/]")
+            for status, filename in diff.unstaged_files:
+                lines.append(f"{indent}  [yellow]{status}[/]  {filename}")
+
+        if diff.untracked_files:
+            lines.append(f"{indent}[red]Untracked:[/]")
+            for filename in diff.untracked_files:
+                lines.append(f"{indent}  [red]?[/]  {filename}")
 
     def _print_diff_summary(self, diffs: list[RepositoryDiff], total_repos: int):
         """Print diff summary line."""
-        total_staged = sum(len(d.staged_files) for d in diffs)
-        total_unstaged = sum(len(d.unstaged_files) for d in diffs)
-        total_untracked = sum(len(d.untracked_files) for d in diffs)
+        summary = self._build_diff_summary_dict(diffs, total_repos)
         parts = [f"[bold]Dirty:[/] {len(diffs)}/{total_repos}"]
-        if total_staged:
-            parts.append(f"[green]Staged:[/] {total_staged}")
-        if total_unstaged:
-            parts.append(f"[yellow]Unstaged:[/] {total_unstaged}")
-        if total_untracked:
-            parts.append(f"[red]Untracked:[/] {total_untracked}")
+        if summary["total_staged"]:
+            parts.append(f"[green]Staged:[/] {summary['total_staged']}")
+        if summary["total_unstaged"]:
+            parts.append(f"[yellow]Unstaged:[/] {summary['total_unstaged']}")
+        if summary["total_untracked"]:
+            parts.append(f"[red]Untracked:[/] {summary['total_untracked']}")
         self.console.print(" | ".join(parts))
 
     @staticmethod
     def _build_diff_summary_dict(diffs: list[RepositoryDiff], total_repos: int) -> dict:
-        """Build diff summary dictionary for JSON output."""
+        """Build diff summary dictionary (JSON output and the summary line)."""
+        staged = unstaged = untracked = 0
+        for d in diffs:
+            staged += len(d.staged_files)
+            unstaged += len(d.unstaged_files)
+            untracked += len(d.untracked_files)
         return {
             "total_repos": total_repos,
             "dirty_repos": len(diffs),
-            "total_staged": sum(len(d.staged_files) for d in diffs),
-            "total_unstaged": sum(len(d.unstaged_files) for d in diffs),
-            "total_untracked": sum(len(d.untracked_files) for d in diffs),
+            "total_staged": staged,
+            "total_unstaged": unstaged,
+            "total_untracked": untracked,
         }
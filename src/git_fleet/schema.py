@@ -2,11 +2,91 @@
 
 from __future__ import annotations
 
+import copy
+import json
+from functools import cache
+
 from ._version import __version__
 
+# Property fragments shared verbatim by several tools
+_ROOTS_PROPERTY = {
+    "type": "string",
+    "description": "Path to roots file (overrides auto-resolution). Auto-resolved from: $GIT_FLEET_ROOTS env var → ~/.config/git-fleet/roots → ~/.git-fleet-roots",
+}
+
+_SEQUENTIAL_PROPERTY = {
+    "type": "boolean",
+    "description": "Run sequentially instead of parallel",
+    "default": False,
+}
+
+_JOBS_PROPERTY = {
+    "type": "integer",
+    "description": "Maximum number of repositories to process in parallel",
+    "default": 8,
+    "minimum": 1,
+}
+
+_INCLUDE_NO_REMOTE_PROPERTY = {
+    "type": "boolean",
+    "description": "Include repositories with no configured remotes",
+    "default": False,
+}
+
+_INCLUDE_DETACHED_PROPERTY = {
+    "type": "boolean",
+    "description": "Include repositories with detached HEAD (e.g. SPM checkouts)",
+    "default": False,
+}
+
+# Remote entry shared by the list --remote and remote output schemas
+_REMOTE_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {
+            "type": "string",
+            "description": "Remote name (e.g., origin, upstream)",
+        },
+        "fetch_url": {"type": "string"},
+        "push_url": {"type": "string"},
+        "protocol": {
+            "type": "string",
+            "enum": [
+                "ssh",
+                "https",
+                "http",
+                "git",
+                "file",
+                "unknown",
+            ],
+        },
+    },
+}
+
+
+def get_tool_schema(include_examples: bool = True) -> dict:
+    """Generate MCP-compatible tool schema for AI agents.
+
+    Pass ``include_examples=False`` to drop the per-tool ``examples`` lists,
+    which only documentation and prompt tooling use. Each call returns a
+    fresh copy that the caller may modify.
+    """
+    return copy.deepcopy(_build_tool_schema(bool(include_examples)))
+
+
+@cache
+def _build_tool_schema(include_examples: bool) -> dict:
+    """Build the tool schema once per variant; the result is shared, never mutate it."""
+    if not include_examples:
+        schema = _build_tool_schema(True)
+        return {
+            **schema,
+            "tools": [
+                {key: value for key, value in tool.items() if key != "examples"}
+                for tool in schema["tools"]
+            ],
+        }
 
-def get_tool_schema() -> dict:
-    """Generate MCP-compatible tool schema for AI agents."""
     return {
         "name": "git-fleet",
         "version": __version__,
@@ -24,10 +104,7 @@ def get_tool_schema() -> dict:
                             "description": "Root path to scan for repositories (default: current directory)",
                             "default": ".",
                         },
-                        "roots": {
-                            "type": "string",
-                            "description": "Path to roots file (overrides auto-resolution). Auto-resolved from: $GIT_FLEET_ROOTS env var → ~/.config/git-fleet/roots → ~/.git-fleet-roots",
-                        },
+                        "roots": _ROOTS_PROPERTY,
                         "json": {
                             "type": "boolean",
                             "description": "Output as JSON for machine parsing",
@@ -38,25 +115,23 @@ def get_tool_schema() -> dict:
                             "description": "Skip fetching from remotes (faster but may show stale data)",
                             "default": False,
                         },
-                        "sequential": {
-                            "type": "boolean",
-                            "description": "Run sequentially instead of parallel",
-                            "default": False,
-                        },
-                        "include_no_remote": {
+                        "sequential": _SEQUENTIAL_PROPERTY,
+                        "include_no_remote": _INCLUDE_NO_REMOTE_PROPERTY,
+                        "include_detached": _INCLUDE_DETACHED_PROPERTY,
+                        "dirty": {
                             "type": "boolean",
-                            "description": "Include repositories with no configured remotes",
+                            "description": "Show only repositories that are not clean and in sync (display filter for the rendered table; ignored when --json is set so machine consumers always receive the full repository list)",
                             "default": False,
                         },
-                        "include_detached": {
+                        "enable_fsmonitor": {
                             "type": "boolean",
-                            "description": "Include repositories with detached HEAD (e.g. SPM checkouts)",
+                            "description": "Opt-in: enable core.untrackedCache (and core.fsmonitor where git supports it) in each repository's local config, leaving already-configured keys alone, so later status scans are faster",
                             "default": False,
                         },
-                        "dirty": {
-                            "type": "boolean",
-                            "description": "Show only repositories that are not clean and in sync (display filter for the rendered table; ignored when --json is set so machine consumers always receive the full repository list)",
-                            "default": False,
+                        "untracked_files": {
+                            "type": "string",
+                            "enum": ["no", "normal", "all"],
+                            "description": "Untracked file scan mode (git --untracked-files). 'no' skips the untracked walk, so untracked counts are reported as 0; omit to use git's configured default",
                         },
                     },
                     "required": [],
@@ -114,6 +189,21 @@ def get_tool_schema() -> dict:
                                 "errors": {"type": "integer"},
                             },
                         },
+                        "enable_fsmonitor_errors": {
+                            "type": "array",
+                            "description": "Present only with --enable-fsmonitor: repositories whose local config could not be updated",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "path": {"type": "string"},
+                                    "name": {"type": "string"},
+                                    "success": {"type": "boolean"},
+                                    "operation": {"type": "string"},
+                                    "message": {"type": "string"},
+                                    "error": {"type": "string"},
+                                },
+                            },
+                        },
                     },
                 },
                 "examples": [
@@ -146,20 +236,14 @@ def get_tool_schema() -> dict:
                             "description": "Root path to scan for repositories (default: current directory)",
                             "default": ".",
                         },
-                        "roots": {
-                            "type": "string",
-                            "description": "Path to roots file (overrides auto-resolution). Auto-resolved from: $GIT_FLEET_ROOTS env var → ~/.config/git-fleet/roots → ~/.git-fleet-roots",
-                        },
+                        "roots": _ROOTS_PROPERTY,
                         "json": {
                             "type": "boolean",
                             "description": "Output as JSON for machine parsing",
                             "default": False,
                         },
-                        "sequential": {
-                            "type": "boolean",
-                            "description": "Run sequentially instead of parallel",
-                            "default": False,
-                        },
+                        "sequential": _SEQUENTIAL_PROPERTY,
+                        "jobs": _JOBS_PROPERTY,
                     },
                     "required": [],
                 },
@@ -237,10 +321,7 @@ def get_tool_schema() -> dict:
                             "description": "Root path to scan for repositories (default: current directory)",
                             "default": ".",
                         },
-                        "roots": {
-                            "type": "string",
-                            "description": "Path to roots file (overrides auto-resolution). Auto-resolved from: $GIT_FLEET_ROOTS env var → ~/.config/git-fleet/roots → ~/.git-fleet-roots",
-                        },
+                        "roots": _ROOTS_PROPERTY,
                         "json": {
                             "type": "boolean",
                             "description": "Output as JSON for machine parsing",
@@ -251,21 +332,10 @@ def get_tool_schema() -> dict:
                             "description": "Show all repositories including clean ones",
                             "default": False,
                         },
-                        "sequential": {
-                            "type": "boolean",
-                            "description": "Run sequentially instead of parallel",
-                            "default": False,
-                        },
-                        "include_no_remote": {
-                            "type": "boolean",
-                            "description": "Include repositories with no configured remotes",
-                            "default": False,
-                        },
-                        "include_detached": {
-                            "type": "boolean",
-                            "description": "Include repositories with detached HEAD (e.g. SPM checkouts)",
-                            "default": False,
-                        },
+                        "sequential": _SEQUENTIAL_PROPERTY,
+                        "jobs": _JOBS_PROPERTY,
+                        "include_no_remote": _INCLUDE_NO_REMOTE_PROPERTY,
+                        "include_detached": _INCLUDE_DETACHED_PROPERTY,
                     },
                     "required": [],
                 },
@@ -347,30 +417,21 @@ def get_tool_schema() -> dict:
                             "description": "Root path to scan for repositories",
                             "default": ".",
                         },
-                        "roots": {
-                            "type": "string",
-                            "description": "Path to roots file (overrides auto-resolution). Auto-resolved from: $GIT_FLEET_ROOTS env var → ~/.config/git-fleet/roots → ~/.git-fleet-roots",
-                        },
+                        "roots": _ROOTS_PROPERTY,
                         "json": {
                             "type": "boolean",
                             "description": "Output as JSON",
                             "default": False,
                         },
-                        "sequential": {
-                            "type": "boolean",
-                            "description": "Run sequentially instead of parallel",
-                            "default": False,
-                        },
-                        "include_no_remote": {
-                            "type": "boolean",
-                            "description": "Include repositories with no configured remotes",
-                            "default": False,
-                        },
-                        "include_detached": {
-                            "type": "boolean",
-                            "description": "Include repositories with detached HEAD (e.g. SPM checkouts)",
-                            "default": False,
+                        "sequential": _SEQUENTIAL_PROPERTY,
+                        "jobs": {
+                            "type": "integer",
+                            "description": "Maximum number of repositories to fetch in parallel",
+                            "default": 8,
+                            "minimum": 1,
                         },
+                        "include_no_remote": _INCLUDE_NO_REMOTE_PROPERTY,
+                        "include_detached": _INCLUDE_DETACHED_PROPERTY,
                     },
                     "required": [],
                 },
@@ -396,10 +457,7 @@ def get_tool_schema() -> dict:
                             "description": "Root path to scan for repositories",
                             "default": ".",
                         },
-                        "roots": {
-                            "type": "string",
-                            "description": "Path to roots file (overrides auto-resolution). Auto-resolved from: $GIT_FLEET_ROOTS env var → ~/.config/git-fleet/roots → ~/.git-fleet-roots",
-                        },
+                        "roots": _ROOTS_PROPERTY,
                         "json": {
                             "type": "boolean",
                             "description": "Output as JSON",
@@ -425,21 +483,9 @@ def get_tool_schema() -> dict:
                             "description": "Skip all conflict-risk repos without file-level check",
                             "default": False,
                         },
-                        "sequential": {
-                            "type": "boolean",
-                            "description": "Run sequentially instead of parallel",
-                            "default": False,
-                        },
-                        "include_no_remote": {
-                            "type": "boolean",
-                            "description": "Include repositories with no configured remotes",
-                            "default": False,
-                        },
-                        "include_detached": {
-                            "type": "boolean",
-                            "description": "Include repositories with detached HEAD (e.g. SPM checkouts)",
-                            "default": False,
-                        },
+                        "sequential": _SEQUENTIAL_PROPERTY,
+                        "include_no_remote": _INCLUDE_NO_REMOTE_PROPERTY,
+                        "include_detached": _INCLUDE_DETACHED_PROPERTY,
                     },
                     "required": [],
                 },
@@ -465,10 +511,7 @@ def get_tool_schema() -> dict:
                             "description": "Root path to scan for repositories",
                             "default": ".",
                         },
-                        "roots": {
-                            "type": "string",
-                            "description": "Path to roots file (overrides auto-resolution). Auto-resolved from: $GIT_FLEET_ROOTS env var → ~/.config/git-fleet/roots → ~/.git-fleet-roots",
-                        },
+                        "roots": _ROOTS_PROPERTY,
                         "json": {
                             "type": "boolean",
                             "description": "Output as JSON",
@@ -484,21 +527,9 @@ def get_tool_schema() -> dict:
                             "description": "Show what would be pushed without actually pushing",
                             "default": False,
                         },
-                        "sequential": {
-                            "type": "boolean",
-                            "description": "Run sequentially instead of parallel",
-                            "default": False,
-                        },
-                        "include_no_remote": {
-                            "type": "boolean",
-                            "description": "Include repositories with no configured remotes",
-                            "default": False,
-                        },
-                        "include_detached": {
-                            "type": "boolean",
-                            "description": "Include repositories with detached HEAD (e.g. SPM checkouts)",
-                            "default": False,
-                        },
+                        "sequential": _SEQUENTIAL_PROPERTY,
+                        "include_no_remote": _INCLUDE_NO_REMOTE_PROPERTY,
+                        "include_detached": _INCLUDE_DETACHED_PROPERTY,
                     },
                     "required": [],
                 },
@@ -524,10 +555,7 @@ def get_tool_schema() -> dict:
                             "description": "Root path to scan for repositories",
                             "default": ".",
                         },
-                        "roots": {
-                            "type": "string",
-                            "description": "Path to roots file (overrides auto-resolution). Auto-resolved from: $GIT_FLEET_ROOTS env var → ~/.config/git-fleet/roots → ~/.git-fleet-roots",
-                        },
+                        "roots": _ROOTS_PROPERTY,
                         "json": {
                             "type": "boolean",
                             "description": "Output as JSON",
@@ -538,27 +566,10 @@ def get_tool_schema() -> dict:
                             "description": "Show what would happen without actually doing it",
                             "default": False,
                         },
-                        "sequential": {
-                            "type": "boolean",
-                            "description": "Run sequentially instead of parallel",
-                            "default": False,
-                        },
-                        "jobs": {
-                            "type": "integer",
-                            "description": "Maximum number of repositories to process in parallel",
-                            "default": 8,
-                            "minimum": 1,
-                        },
-                        "include_no_remote": {
-                            "type": "boolean",
-                            "description": "Include repositories with no configured remotes",
-                            "default": False,
-                        },
-                        "include_detached": {
-                            "type": "boolean",
-                            "description": "Include repositories with detached HEAD (e.g. SPM checkouts)",
-                            "default": False,
-                        },
+                        "sequential": _SEQUENTIAL_PROPERTY,
+                        "jobs": _JOBS_PROPERTY,
+                        "include_no_remote": _INCLUDE_NO_REMOTE_PROPERTY,
+                        "include_detached": _INCLUDE_DETACHED_PROPERTY,
                         "all_remotes": {
                             "type": "boolean",
                             "description": "Fetch all remotes before syncing instead of only the upstream/origin remote",
@@ -607,10 +618,7 @@ def get_tool_schema() -> dict:
                             "description": "Root path to scan for repositories",
                             "default": ".",
                         },
-                        "roots": {
-                            "type": "string",
-                            "description": "Path to roots file (overrides auto-resolution). Auto-resolved from: $GIT_FLEET_ROOTS env var → ~/.config/git-fleet/roots → ~/.git-fleet-roots",
-                        },
+                        "roots": _ROOTS_PROPERTY,
                         "paths": {
                             "type": "boolean",
                             "description": "Output only paths (one per line, for piping to fzf etc.)",
@@ -643,28 +651,7 @@ def get_tool_schema() -> dict:
                                     "remotes": {
                                         "type": "array",
                                         "description": "Only present when --remote is used",
-                                        "items": {
-                                            "type": "object",
-                                            "properties": {
-                                                "name": {
-                                                    "type": "string",
-                                                    "description": "Remote name (e.g., origin, upstream)",
-                                                },
-                                                "fetch_url": {"type": "string"},
-                                                "push_url": {"type": "string"},
-                                                "protocol": {
-                                                    "type": "string",
-                                                    "enum": [
-                                                        "ssh",
-                                                        "https",
-                                                        "http",
-                                                        "git",
-                                                        "file",
-                                                        "unknown",
-                                                    ],
-                                                },
-                                            },
-                                        },
+                                        "items": _REMOTE_ITEM_SCHEMA,
                                     },
                                 },
                             },
@@ -701,20 +688,14 @@ def get_tool_schema() -> dict:
                             "description": "Root path to scan for repositories (default: current directory)",
                             "default": ".",
                         },
-                        "roots": {
-                            "type": "string",
-                            "description": "Path to roots file (overrides auto-resolution). Auto-resolved from: $GIT_FLEET_ROOTS env var → ~/.config/git-fleet/roots → ~/.git-fleet-roots",
-                        },
+                        "roots": _ROOTS_PROPERTY,
                         "json": {
                             "type": "boolean",
                             "description": "Output as JSON for machine parsing",
                             "default": False,
                         },
-                        "sequential": {
-                            "type": "boolean",
-                            "description": "Run sequentially instead of parallel",
-                            "default": False,
-                        },
+                        "sequential": _SEQUENTIAL_PROPERTY,
+                        "jobs": _JOBS_PROPERTY,
                     },
                     "required": [],
                 },
@@ -730,28 +711,7 @@ def get_tool_schema() -> dict:
                                     "name": {"type": "string"},
                                     "remotes": {
                                         "type": "array",
-                                        "items": {
-                                            "type": "object",
-                                            "properties": {
-                                                "name": {
-                                                    "type": "string",
-                                                    "description": "Remote name (e.g., origin, upstream)",
-                                                },
-                                                "fetch_url": {"type": "string"},
-                                                "push_url": {"type": "string"},
-                                                "protocol": {
-                                                    "type": "string",
-                                                    "enum": [
-                                                        "ssh",
-                                                        "https",
-                                                        "http",
-                                                        "git",
-                                                        "file",
-                                                        "unknown",
-                                                    ],
-                                                },
-                                            },
-                                        },
+                                        "items": _REMOTE_ITEM_SCHEMA,
                                     },
                                 },
                             },
@@ -784,7 +744,7 @@ def get_tool_schema() -> dict:
         "globalOptions": {
             "--json, -j": "Output in JSON format (recommended for AI agents)",
             "--sequential, -s": "Run operations sequentially instead of parallel",
-            "--jobs, -J": "Maximum number of repositories to process in parallel (sync)",
+            "--jobs, -J": "Maximum number of repositories to process in parallel (fetch/sync/who/diff/remote)",
             "--dry-run, -n": "Preview operations without executing (available for pull/push/sync)",
             "--roots, -r": "Path to roots file (overrides auto-resolution)",
             "--include-no-remote": "Include repositories with no configured remotes (status/fetch/pull/push/sync/diff)",
@@ -825,3 +785,24 @@ def get_tool_schema() -> dict:
             "Operations that encounter case-insensitive filesystem ref conflicts (macOS) are automatically recovered and reported as warnings in JSON output (warning field in results, warned count in summary)",
         ],
     }
+
+
+@cache
+def get_tool_schema_json(indent: int | None = None) -> str:
+    """Serialize the tool schema to JSON once per indent and cache the text."""
+    return json.dumps(_build_tool_schema(True), indent=indent)
+
+
+@cache
+def _tool_index() -> dict[str, dict]:
+    """Map tool names to their cached schema entries."""
+    return {tool["name"]: tool for tool in _build_tool_schema(True)["tools"]}
+
+
+def get_tool_schema_for(name: str) -> dict:
+    """Return the schema entry for a single tool.
+
+    Raises:
+        KeyError: If no tool with that name exists
+    """
+    return copy.deepcopy(_tool_index()[name])